@@ -0,0 +1,45 @@
+#N-Queens solvers. Public names are resolved on first access, so 'import nqueens' loads
+#nothing but this file; solver modules only need the standard library, while numpy
+#(batch_conflicts, BoardFile.load / verify), matplotlib (plot / display_board), ipywidgets
+#(interface) and pandas (test_config) are imported only by the functions that use them.
+from importlib import import_module
+
+_EXPORTS = {
+    'Board': 'board',
+    'CompactBoard': 'board',
+    'ConflictCounter': 'board',
+    'CSP': 'csp',
+    'LocalSearch': 'local_search',
+    'MinConflicts': 'min_conflicts',
+    'Constructive': 'constructive',
+    'SolutionCounter': 'solution_counter',
+    'Portfolio': 'portfolio',
+    'SolutionCache': 'solution_cache',
+    'BoardFile': 'board_file',
+    'Checkpointer': 'checkpoint',
+    'SolveService': 'solve_service',
+    'Benchmark': 'benchmark',
+    'Profiler': 'profiling',
+    'StepEvent': 'step_events',
+    'BoardReplayer': 'step_events',
+    'count_conflicts_batch': 'batch_conflicts',
+    'validate_batch': 'batch_conflicts',
+    'run_interface': 'interface',
+    'plot_scaling': 'plot',
+    'run_config': 'test_config',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f'.{module}', __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
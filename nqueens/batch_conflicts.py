@@ -0,0 +1,31 @@
+import numpy as np
+
+
+#O(B*N) vectorized ; same counting as Board.count_conflicts for a (B, N) array of boards
+def count_conflicts_batch(boards) -> np.ndarray:
+    boards = np.asarray(boards)
+    if boards.ndim == 1:
+        boards = boards[np.newaxis, :]
+    if boards.ndim != 2:
+        raise ValueError(f"Expected a 2-D (B, N) array of boards, got shape {boards.shape}")
+    B, N = boards.shape
+    if B == 0 or N == 0:
+        return np.zeros(B, dtype=np.int64)
+    rows = boards.astype(np.int64, copy=False)
+    if rows.min() < 0 or rows.max() >= N:
+        raise ValueError(f"Board rows must be in [0, {N - 1}]")
+
+    cols = np.arange(N, dtype=np.int64)
+    #all three line families in one bincount, 5N slots per board: rows r in [0, N),
+    #main diagonals r - c + N shifted to [N, 3N), anti-diagonals r + c shifted to [3N, 5N)
+    offsets = np.stack([np.zeros(N, dtype=np.int64), 2 * N - cols, 3 * N + cols])
+    ids = (rows + np.arange(0, B * 5 * N, 5 * N, dtype=np.int64)[:, np.newaxis])[:, np.newaxis, :] + offsets
+    counts = np.bincount(ids.ravel(), minlength=B * 5 * N).reshape(B, 5 * N)
+
+    #sum of k(k-1)/2 over lines = (sum k^2 - sum k) / 2, and every family holds N queens
+    return (np.einsum('ij,ij->i', counts, counts) - 3 * N) // 2
+
+
+def validate_batch(boards) -> np.ndarray:
+    #boolean mask: True where the board is a solution (zero conflicts)
+    return count_conflicts_batch(boards) == 0
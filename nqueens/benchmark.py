@@ -0,0 +1,181 @@
+import csv
+import json
+import os
+import platform
+import time
+import tracemalloc
+from time import perf_counter
+from typing import Dict, List, Optional, Tuple
+
+from .board import Board
+from .constructive import Constructive
+from .csp import CSP
+from .local_search import LocalSearch
+from .min_conflicts import MinConflicts
+
+
+class Benchmark:
+    #Scaling benchmark: every solver runs on N = 8, 16, 32, ... up to its own largest size,
+    #once per seed after an untimed warmup; a solver's sweep stops after a size where no seed
+    #succeeded (larger sizes would only time out as well). Timing runs use perf_counter; peak memory comes from
+    #one extra run under tracemalloc so tracing does not distort the timings.
+    MAX_N = {
+        'local_search': 64,
+        'csp': 32,
+        'csp_bitmask': 64,
+        'min_conflicts': 2 ** 20,
+        'constructive': 2 ** 20,
+    }
+
+    FIELDS = ['solver', 'N', 'runs', 'success_rate', 'runtime_median', 'runtime_p95', 'runtime_min',
+              'steps_median', 'restarts_median', 'peak_memory', 'timestamp', 'python']
+
+    def __init__(self, solvers: Optional[List[str]] = None, seeds: Optional[List[int]] = None,
+                 max_n: Optional[Dict[str, int]] = None, min_n: int = 8, time_limit: float = 30.0):
+        self.max_n = dict(self.MAX_N)
+        if max_n:
+            self.max_n.update(max_n)
+        self.solvers = solvers if solvers is not None else list(self.MAX_N)
+        for solver in self.solvers:
+            if solver not in self.max_n:
+                raise ValueError(f"Unknown solver {solver!r}, expected one of {list(self.max_n)}")
+        self.seeds = seeds if seeds is not None else [1, 5, 12, 14]
+        self.min_n = min_n
+        self.time_limit = time_limit
+        self.results = []
+
+    def sizes(self, solver: str) -> List[int]:
+        #log scale: powers of two from min_n up to the solver's limit
+        sizes = []
+        N = self.min_n
+        while N <= self.max_n[solver]:
+            sizes.append(N)
+            N *= 2
+        return sizes
+
+    def run_once(self, solver: str, bo: Board, seed: int) -> Tuple[Optional[List[int]], dict]:
+        if solver == 'local_search':
+            return LocalSearch(bo).local_search_auto(seed=seed)
+        if solver == 'csp':
+            return CSP(bo).csp_auto(time_limit=self.time_limit)
+        if solver == 'csp_bitmask':
+            return CSP(bo, backend='bitmask').csp_auto(time_limit=self.time_limit)
+        if solver == 'min_conflicts':
+            return MinConflicts(bo).min_conflicts_auto(seed=seed)
+        return Constructive(bo).constructive_auto()
+
+    def measure(self, solver: str, N: int) -> dict:
+        #warmup (imports, allocator, caches)
+        self.run_once(solver, Board(N, self.seeds[0]), self.seeds[0])
+
+        runtimes, steps, restarts, successes = [], [], [], 0
+        for seed in self.seeds:
+            #board construction is not part of the timed region
+            bo = Board(N, seed)
+            t0 = perf_counter()
+            sol, stats = self.run_once(solver, bo, seed)
+            runtimes.append(perf_counter() - t0)
+            steps.append(stats.get('steps', 0))
+            restarts.append(stats.get('restarts', 0))
+            if sol is not None and stats.get('success'):
+                successes += 1
+
+        bo = Board(N, self.seeds[0])
+        tracemalloc.start()
+        try:
+            self.run_once(solver, bo, self.seeds[0])
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        return {
+            'solver': solver,
+            'N': N,
+            'runs': len(self.seeds),
+            'success_rate': successes / len(self.seeds),
+            'runtime_median': _percentile(runtimes, 50),
+            'runtime_p95': _percentile(runtimes, 95),
+            'runtime_min': min(runtimes),
+            'steps_median': _percentile(steps, 50),
+            'restarts_median': _percentile(restarts, 50),
+            'peak_memory': peak,
+            'timestamp': time.time(),
+            'python': platform.python_version()
+        }
+
+    def run(self, verbose: bool = False) -> List[dict]:
+        self.results = []
+        for solver in self.solvers:
+            for N in self.sizes(solver):
+                record = self.measure(solver, N)
+                self.results.append(record)
+                if verbose:
+                    print(f"{solver:>14} N={N:<8} median={record['runtime_median']:.6f}s "
+                          f"p95={record['runtime_p95']:.6f}s success={record['success_rate']:.2f}")
+                if record['success_rate'] == 0:
+                    break
+        return self.results
+
+    def save(self, path: str) -> None:
+        #appends to a history file: .csv gets rows, anything else is a JSON list
+        if path.endswith('.csv'):
+            new_file = not os.path.exists(path)
+            with open(path, 'a', newline='') as f:
+                writer = csv.DictWriter(f, fieldnames=self.FIELDS)
+                if new_file:
+                    writer.writeheader()
+                writer.writerows(self.results)
+            return
+        history = self.load(path) if os.path.exists(path) else []
+        history.extend(self.results)
+        with open(path, 'w') as f:
+            json.dump(history, f, indent=1)
+
+    @staticmethod
+    def load(path: str) -> List[dict]:
+        if path.endswith('.csv'):
+            with open(path, newline='') as f:
+                rows = list(csv.DictReader(f))
+            for row in rows:
+                for key, value in row.items():
+                    if key not in ('solver', 'python'):
+                        row[key] = float(value)
+                row['N'] = int(row['N'])
+            return rows
+        with open(path) as f:
+            return json.load(f)
+
+    def compare(self, baseline_path: str, tolerance: float = 0.25) -> List[dict]:
+        #regressions against the latest baseline record for each (solver, N):
+        #median runtime more than 'tolerance' slower, or a lower success rate
+        baseline = {}
+        for record in self.load(baseline_path):
+            baseline[(record['solver'], int(record['N']))] = record
+        regressions = []
+        for record in self.results:
+            base = baseline.get((record['solver'], record['N']))
+            if base is None:
+                continue
+            slowdown = record['runtime_median'] / max(1e-9, base['runtime_median'])
+            if slowdown > 1 + tolerance or record['success_rate'] < base['success_rate']:
+                regressions.append({
+                    'solver': record['solver'],
+                    'N': record['N'],
+                    'runtime_median': record['runtime_median'],
+                    'baseline_median': base['runtime_median'],
+                    'slowdown': slowdown,
+                    'success_rate': record['success_rate'],
+                    'baseline_success_rate': base['success_rate']
+                })
+        return regressions
+
+
+#linear interpolation between closest ranks
+def _percentile(values: List[float], q: float) -> float:
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    pos = (len(ordered) - 1) * q / 100
+    lo = int(pos)
+    hi = min(lo + 1, len(ordered) - 1)
+    return ordered[lo] + (ordered[hi] - ordered[lo]) * (pos - lo)
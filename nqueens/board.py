@@ -0,0 +1,150 @@
+import random
+from array import array
+from typing import Dict, List, Optional
+
+
+class Board:
+    def __init__(self, N:int = 8, seed:Optional[int]=None):
+        self.N = N
+        self.seed = seed
+        if seed is not None:
+            random.seed(seed)
+        self.board = self.random_board()
+
+    def random_board(self) -> List[int]:
+        return [random.randint(0, self.N - 1) for _ in range(self.N)]
+
+    #O(N)
+    @staticmethod
+    def count_conflicts(board: List[int]) -> int:
+        N = len(board)
+        col_counts = [0] * N
+        #main diagonal ; no. of unique main diagonal lines = 2N-1
+        main_diag_counts = [0] * (2 * N)
+        #anti-diagonal ;  no. of unique anti diagonal lines = 2N-1
+        anti_diag_counts = [0] * (2 * N)
+
+        for c, r in enumerate(board):
+            col_counts[r] += 1
+            #shifted by +N to avoid negative indices
+            main_diag_counts[r - c + N] += 1
+            anti_diag_counts[r + c] += 1
+
+        conflicts = 0
+        for counts in (col_counts, main_diag_counts, anti_diag_counts):
+            for cnt in counts:
+                if cnt > 1:
+                     # combinations of attacking queens = nC2
+                    conflicts += cnt * (cnt - 1) // 2
+        return conflicts
+
+    def display_board(self, board: Optional[List[int]] = None, title: str = ""):
+        #imported here so the solvers never pull in the plotting stack (see render.BoardRenderer)
+        from .render import render_board
+        if board is None:
+            board = self.board
+        render_board(board, title)
+
+
+class CompactBoard:
+    #Same interface as Board, but the state is an array('i') (or a NumPy int32 array when
+    #rng is a numpy.random.Generator): 4 bytes per queen instead of a list of int objects.
+    #Randomness comes from a private seeded RNG, not the global random.seed.
+    __slots__ = ('N', 'seed', 'rng', 'board')
+    CHUNK = 1 << 16
+
+    def __init__(self, N: int = 8, seed: Optional[int] = None, rng=None):
+        self.N = N
+        self.seed = seed
+        self.rng = rng if rng is not None else random.Random(seed)
+        self.board = self.random_board()
+
+    def random_board(self):
+        #bulk initialisation: one call for the whole board instead of one randint per column
+        if hasattr(self.rng, 'integers'):
+            return self.rng.integers(0, self.N, size=self.N, dtype='int32')
+        #chunked, so the temporary list of Python ints stays bounded and the board is built at
+        #4 bytes per queen; the same rows as one choices(k=N) call
+        board = array('i')
+        population = range(self.N)
+        for start in range(0, self.N, self.CHUNK):
+            board.extend(self.rng.choices(population, k=min(self.CHUNK, self.N - start)))
+        return board
+
+    count_conflicts = staticmethod(Board.count_conflicts)
+    display_board = Board.display_board
+
+def pinned_rows(pinned, N: int) -> Dict[int, int]:
+    #pins as {col: row}; accepts a dict or (col, row) pairs. Pins that attack each other
+    #can never be part of a solution, so they are rejected here rather than searched.
+    pins = {}
+    for col, row in (pinned.items() if isinstance(pinned, dict) else (pinned or ())):
+        if not (0 <= col < N and 0 <= row < N):
+            raise ValueError(f"Pin ({col}, {row}) is outside the {N}x{N} board")
+        if pins.get(col, row) != row:
+            raise ValueError(f"Column {col} is pinned to two rows ({pins[col]} and {row})")
+        pins[col] = row
+    ordered = sorted(pins.items())
+    if len({r for _, r in ordered}) < len(ordered) or len({r - c for c, r in ordered}) < len(ordered) \
+            or len({r + c for c, r in ordered}) < len(ordered):
+        raise ValueError("Pinned queens attack each other")
+    return pins
+
+
+class ConflictCounter:
+    #Keeps the row / diagonal counters of count_conflicts alive across moves,
+    #so the conflict delta of moving one queen is O(1) instead of a full O(N) recount.
+    #The board list is updated in place by move().
+    def __init__(self, board: List[int]):
+        N = len(board)
+        self.N = N
+        self.board = board
+        self.col_counts = [0] * N
+        self.main_diag_counts = [0] * (2 * N)
+        self.anti_diag_counts = [0] * (2 * N)
+
+        for c, r in enumerate(board):
+            self.col_counts[r] += 1
+            self.main_diag_counts[r - c + N] += 1
+            self.anti_diag_counts[r + c] += 1
+
+        conflicts = 0
+        for counts in (self.col_counts, self.main_diag_counts, self.anti_diag_counts):
+            for cnt in counts:
+                if cnt > 1:
+                    conflicts += cnt * (cnt - 1) // 2
+        self.conflicts = conflicts
+
+    #O(1)
+    def delta(self, col: int, new_row: int) -> int:
+        #change in conflicts if the queen in 'col' moved to 'new_row'
+        #leaving a line with k queens removes k-1 pairs, joining a line with m queens adds m pairs
+        old_row = self.board[col]
+        if new_row == old_row:
+            return 0
+        N = self.N
+        return ((self.col_counts[new_row] - self.col_counts[old_row] + 1)
+                + (self.main_diag_counts[new_row - col + N] - self.main_diag_counts[old_row - col + N] + 1)
+                + (self.anti_diag_counts[new_row + col] - self.anti_diag_counts[old_row + col] + 1))
+
+    #O(1)
+    def attacked(self, col: int) -> bool:
+        #True if the queen in 'col' shares its row or a diagonal with another queen
+        r = self.board[col]
+        return self.col_counts[r] > 1 or self.main_diag_counts[r - col + self.N] > 1 or self.anti_diag_counts[r + col] > 1
+
+    #O(1)
+    def move(self, col: int, new_row: int) -> int:
+        #apply the move in place and return the new conflict count
+        d = self.delta(col, new_row)
+        old_row = self.board[col]
+        N = self.N
+        self.col_counts[old_row] -= 1
+        self.main_diag_counts[old_row - col + N] -= 1
+        self.anti_diag_counts[old_row + col] -= 1
+        self.col_counts[new_row] += 1
+        self.main_diag_counts[new_row - col + N] += 1
+        self.anti_diag_counts[new_row + col] += 1
+        self.board[col] = new_row
+        self.conflicts += d
+        return self.conflicts
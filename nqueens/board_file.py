@@ -0,0 +1,178 @@
+import os
+import struct
+import sys
+import zlib
+from array import array
+from typing import Iterator, List, Optional, Tuple
+
+from .board import Board
+
+
+class BoardFile:
+    #Binary board file: a sequence of records, each a 64-byte header followed by the board as N
+    #little-endian int32 rows (board[col] = row). Records are appended, so one file can hold a whole
+    #solution set. Header: magic, flags (bit 0: seed is set), N, seed, conflicts, CRC-32 of the
+    #payload, solver name (16 bytes, NUL padded). Payloads start on 8-byte boundaries, so load()
+    #returns a zero-copy numpy.memmap; numpy is only imported by load() / verify().
+    MAGIC = b'NQB1'
+    HEADER = struct.Struct('<4sIqqqQ16s8x')
+    HAS_SEED = 1
+
+    def __init__(self, path: str):
+        self.path = path
+        #(header dict, payload offset) per record
+        self.records = []
+        if os.path.exists(path):
+            self._scan()
+
+    def _scan(self) -> None:
+        #O(records): reads headers only, payloads are skipped
+        size = os.path.getsize(self.path)
+        with open(self.path, 'rb') as f:
+            offset = 0
+            while offset < size:
+                f.seek(offset)
+                header = self._unpack(f.read(self.HEADER.size), offset)
+                payload = offset + self.HEADER.size
+                end = payload + 4 * header['N']
+                if end > size:
+                    raise ValueError(f"Truncated board record at offset {offset} in {self.path}")
+                self.records.append((header, payload))
+                offset = end + (-end) % 8
+
+    def _unpack(self, raw: bytes, offset: int) -> dict:
+        if len(raw) < self.HEADER.size:
+            raise ValueError(f"Truncated board header at offset {offset} in {self.path}")
+        magic, flags, N, seed, conflicts, checksum, solver = self.HEADER.unpack(raw)
+        if magic != self.MAGIC:
+            raise ValueError(f"Not a board record at offset {offset} in {self.path} (magic {magic!r})")
+        return {
+            'N': N,
+            'solver': solver.rstrip(b'\0').decode('ascii'),
+            'seed': seed if flags & self.HAS_SEED else None,
+            'conflicts': conflicts,
+            'checksum': checksum
+        }
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def header(self, index: int) -> dict:
+        return dict(self.records[index][0])
+
+    def headers(self) -> List[dict]:
+        return [dict(header) for header, _ in self.records]
+
+    def append(self, board, solver: str = '', seed: Optional[int] = None, conflicts: Optional[int] = None) -> int:
+        #board: list, array('i') or int32-compatible NumPy array. conflicts=None counts them
+        #(O(N)); solvers pass their final count. Returns the index of the new record.
+        if hasattr(board, 'dtype'):
+            payload = board.astype('<i4', copy=False)
+            data = payload.tobytes() if not payload.flags['C_CONTIGUOUS'] else payload.data
+        else:
+            payload = array('i', board)
+            if sys.byteorder == 'big':
+                payload.byteswap()
+            data = payload
+        N = len(board)
+        if conflicts is None:
+            conflicts = Board.count_conflicts(board)
+        name = solver.encode('ascii')
+        if len(name) > 16:
+            raise ValueError(f"Solver name {solver!r} is longer than 16 bytes")
+        header = {
+            'N': N,
+            'solver': solver,
+            'seed': seed,
+            'conflicts': conflicts,
+            'checksum': zlib.crc32(data)
+        }
+        with open(self.path, 'ab') as f:
+            offset = f.tell()
+            #re-align if the file was not written by BoardFile
+            if offset % 8:
+                f.write(b'\0' * (-offset % 8))
+                offset += -offset % 8
+            f.write(self.HEADER.pack(self.MAGIC, self.HAS_SEED if seed is not None else 0, N,
+                                     seed if seed is not None else 0, conflicts, header['checksum'], name))
+            f.write(data)
+            f.write(b'\0' * (-(4 * N) % 8))
+        self.records.append((header, offset + self.HEADER.size))
+        return len(self.records) - 1
+
+    def load(self, index: int):
+        #read-only numpy.memmap of the board: nothing is read until rows are accessed
+        import numpy as np
+
+        header, payload = self.records[index]
+        if header['N'] == 0:
+            return np.zeros(0, dtype='<i4')
+        return np.memmap(self.path, dtype='<i4', mode='r', offset=payload, shape=(header['N'],))
+
+    def __iter__(self) -> Iterator[Tuple[dict, object]]:
+        for index in range(len(self.records)):
+            yield self.header(index), self.load(index)
+
+    def verify(self, index: int, chunk_size: int = 1 << 20, memory_limit: int = 256 << 20) -> dict:
+        #Streaming check of one record with bounded memory: the payload is read chunk_size rows at a
+        #time and never held in full. Conflicts follow Board.count_conflicts (k queens on a row or
+        #diagonal add k(k-1)/2). Line counters are int32 and kept in windows of at most memory_limit
+        #bytes: one pass over the payload per window, e.g. N=10^8 at 256 MB takes 10 passes.
+        import numpy as np
+
+        header, payload = self.records[index]
+        N = header['N']
+        window = max(1, memory_limit // 4)
+        chunk_size = max(1, chunk_size)
+        buf = bytearray(4 * min(chunk_size, max(1, N)))
+        #(family, first line, end): rows r, main diagonals r - c + N, anti-diagonals r + c
+        windows = [(family, lo, min(size, lo + window))
+                   for family, size in ((0, N), (1, 2 * N), (2, 2 * N)) for lo in range(0, size, window)]
+        checksum = 0
+        in_range = True
+        conflicts = 0
+        passes = 0
+        with open(self.path, 'rb') as f:
+            for family, lo, hi in windows or [(0, 0, 0)]:
+                counts = np.zeros(hi - lo, dtype=np.int32)
+                passes += 1
+                f.seek(payload)
+                col = 0
+                while col < N:
+                    n = min(chunk_size, N - col)
+                    view = memoryview(buf)[:4 * n]
+                    if f.readinto(view) != 4 * n:
+                        raise ValueError(f"Truncated payload of record {index} in {self.path}")
+                    rows = np.frombuffer(buf, dtype='<i4', count=n).astype(np.int64)
+                    if passes == 1:
+                        checksum = zlib.crc32(view, checksum)
+                        if rows.min() < 0 or rows.max() >= N:
+                            in_range = False
+                            break
+                    if family == 0:
+                        ids = rows
+                    else:
+                        cols = np.arange(col, col + n, dtype=np.int64)
+                        ids = rows - cols + N if family == 1 else rows + cols
+                    if lo > 0 or hi < N * (1 + (family > 0)):
+                        ids = ids[(ids >= lo) & (ids < hi)]
+                    #bincount is a single pass; np.add.at is unbuffered and several times slower
+                    counts += np.bincount(ids - lo, minlength=hi - lo).astype(np.int32, copy=False)
+                    col += n
+                if not in_range:
+                    break
+                for start in range(0, hi - lo, chunk_size):
+                    k = counts[start:start + chunk_size].astype(np.int64)
+                    conflicts += int((k * (k - 1) // 2).sum())
+                del counts
+
+        checksum_ok = checksum == header['checksum']
+        return {
+            'N': N,
+            'valid': in_range and checksum_ok and conflicts == 0,
+            'checksum_ok': checksum_ok,
+            'in_range': in_range,
+            'conflicts': conflicts if in_range else None,
+            'header_conflicts_ok': in_range and conflicts == header['conflicts'],
+            'passes': passes
+        }
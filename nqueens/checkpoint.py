@@ -0,0 +1,86 @@
+import json
+import os
+import random
+import time
+from time import perf_counter
+from typing import Optional, Union
+
+#Checkpoint files are JSON objects: the context given to Checkpointer (solver kind, N, settings)
+#plus the search state passed to save(). 'runtime' is cumulative over resumed sessions.
+VERSION = 1
+
+
+class Checkpointer:
+    #Periodic, atomic checkpoint writer for long searches (CSP.csp_auto / csp_repair,
+    #LocalSearch.local_search_auto). Solvers call due() at safe points and save() when it is true.
+    #Writes go to a temporary file that is fsynced and renamed over 'path', so a preempted run
+    #always leaves the previous complete checkpoint. A checkpoint is due every 'interval' seconds,
+    #and after a write that took d seconds not before d / max_overhead seconds, so writing costs at
+    #most ~max_overhead of the run time however large the state is.
+    def __init__(self, path: str, interval: float = 30.0, max_overhead: float = 0.05,
+                 context: Optional[dict] = None, runtime: float = 0.0):
+        self.path = path
+        self.interval = interval
+        self.max_overhead = max_overhead
+        self.context = dict(context or {})
+        self.started = time.time() - runtime
+        self.writes = 0
+        self.write_time = 0.0
+        self.next_due = perf_counter() + interval
+
+    def due(self) -> bool:
+        return perf_counter() >= self.next_due
+
+    def save(self, **state) -> None:
+        t0 = perf_counter()
+        data = dict(self.context, version=VERSION, saved=time.time(), runtime=time.time() - self.started, **state)
+        tmp = self.path + '.tmp'
+        with open(tmp, 'w') as f:
+            json.dump(data, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.path)
+        elapsed = perf_counter() - t0
+        self.writes += 1
+        self.write_time += elapsed
+        self.next_due = perf_counter() + max(self.interval, elapsed / max(1e-9, self.max_overhead))
+
+    def clear(self) -> None:
+        #the search finished: nothing left to resume
+        for path in (self.path, self.path + '.tmp'):
+            if os.path.exists(path):
+                os.remove(path)
+
+
+def load_checkpoint(path: str, kind: str) -> dict:
+    with open(path) as f:
+        data = json.load(f)
+    if data.get('version') != VERSION:
+        raise ValueError(f"Unsupported checkpoint version {data.get('version')!r} in {path}")
+    if data.get('kind') != kind:
+        raise ValueError(f"{path} is a {data.get('kind')!r} checkpoint, expected {kind!r}")
+    return data
+
+
+#RNG state as JSON values and back: the global random module (default), a random.Random, or a
+#numpy.random.Generator (bit_generator.state, e.g. CompactBoard's rng)
+def rng_state(rng=random) -> Union[list, dict]:
+    if hasattr(rng, 'bit_generator'):
+        return _plain(rng.bit_generator.state)
+    version, internal, gauss_next = rng.getstate()
+    return [version, list(internal), gauss_next]
+
+
+def set_rng_state(state: Union[list, dict], rng=random) -> None:
+    if hasattr(rng, 'bit_generator'):
+        rng.bit_generator.state = state
+        return
+    version, internal, gauss_next = state
+    rng.setstate((version, tuple(internal), gauss_next))
+
+
+def _plain(value):
+    #MT19937, Philox and SFC64 states hold NumPy arrays; the setters accept lists
+    if isinstance(value, dict):
+        return {key: _plain(item) for key, item in value.items()}
+    return value.tolist() if hasattr(value, 'tolist') else value
@@ -0,0 +1,156 @@
+import argparse
+import json
+import sys
+import time
+from multiprocessing import Pool
+from typing import Iterable, List, Optional
+
+from .board import Board
+from .board_file import BoardFile
+from .constructive import Constructive
+from .csp import CSP
+from .local_search import LocalSearch
+from .min_conflicts import MinConflicts
+
+#Batch runner: one NDJSON line per finished job.
+#  python -m nqueens --method csp --N 8
+#  python -m nqueens --job 8:1:csp --job 1000:3:min_conflicts --jobs 2
+#  printf '16 1 local_search\n{"N": 32, "seed": 2, "method": "csp"}\n' | python -m nqueens --jobs 4
+#  python -m nqueens --method min_conflicts --N 1000000 --no-board --save solutions.nqb
+#matplotlib is only imported with --plot; pandas and ipywidgets are never needed here.
+
+METHODS = ('csp', 'local_search', 'min_conflicts', 'constructive')
+
+
+def parse_job(text: str, defaults: dict) -> dict:
+    #'N', 'N:seed', 'N seed method' or a JSON object {"N": .., "seed": .., "method": .., ...}
+    text = text.strip()
+    if text.startswith('{'):
+        job = dict(defaults, **json.loads(text))
+    else:
+        parts = text.replace(':', ' ').split()
+        job = dict(defaults)
+        job['N'] = int(parts[0])
+        if len(parts) > 1:
+            job['seed'] = None if parts[1].lower() == 'none' else int(parts[1])
+        if len(parts) > 2:
+            job['method'] = parts[2]
+    if not isinstance(job.get('N'), int):
+        raise ValueError(f"Expected an integer board size N, got {job.get('N')!r}")
+    if job['method'] not in METHODS:
+        raise ValueError(f"Unknown method {job['method']!r}, expected one of {METHODS}")
+    return job
+
+
+def parse_job_or_error(text: str, defaults: dict) -> dict:
+    #a malformed line becomes an error job, reported as its own record instead of ending the batch
+    try:
+        return parse_job(text, defaults)
+    except (ValueError, TypeError) as e:
+        return {'error': str(e), 'input': text.strip()}
+
+
+def read_jobs(lines: Iterable[str], defaults: dict) -> List[dict]:
+    return [parse_job_or_error(line, defaults) for line in lines
+            if line.strip() and not line.lstrip().startswith('#')]
+
+
+def run_job(job: dict) -> dict:
+    if 'error' in job:
+        return {'index': job.get('index'), 'success': False, 'error': job['error'], 'input': job['input']}
+    N, seed, method = job['N'], job.get('seed'), job['method']
+    start_time = time.time()
+    try:
+        bo = Board(N, seed)
+        if method == 'csp':
+            sol, stats = CSP(bo, backend=job.get('backend', 'sets'),
+                             heuristics=job.get('heuristics', 'scan')).csp_auto(time_limit=job.get('time_limit'))
+        elif method == 'local_search':
+            sol, stats = LocalSearch(bo).local_search_auto(seed=seed)
+        elif method == 'min_conflicts':
+            sol, stats = MinConflicts(bo).min_conflicts_auto(seed=seed)
+        else:
+            sol, stats = Constructive(bo).constructive_auto()
+    except Exception as e:
+        sol, stats = None, {'success': False, 'error': repr(e), 'runtime': time.time() - start_time}
+
+    record = {'index': job.get('index'), 'N': N, 'seed': seed, 'method': method}
+    record.update(stats)
+    if job.get('board', True):
+        record['board'] = list(sol) if sol is not None else None
+    return record
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='nqueens', description='Batch N-Queens solver with NDJSON output.')
+    parser.add_argument('--N', type=int, help='board size for a single job')
+    parser.add_argument('--seed', type=int, default=None, help='seed for --N (and default for other jobs)')
+    parser.add_argument('--method', choices=METHODS, default='csp', help='solver (default for all jobs)')
+    parser.add_argument('--job', action='append', default=[], metavar='N[:seed[:method]]',
+                        help='add a job; repeatable. Without --N/--job, jobs are read from stdin')
+    parser.add_argument('--jobs', type=int, default=1, help='number of worker processes')
+    parser.add_argument('--time-limit', type=float, default=30.0, help='CSP time limit per job (s)')
+    parser.add_argument('--backend', choices=CSP.BACKENDS, default='sets', help='CSP backend')
+    parser.add_argument('--heuristics', choices=CSP.HEURISTICS, default='scan', help='CSP heuristics')
+    parser.add_argument('--no-board', action='store_true', help='omit boards from the output')
+    parser.add_argument('--save', metavar='PATH', help='append solved boards to a binary board file (see board_file.py)')
+    parser.add_argument('--plot', action='store_true', help='display solved boards (imports matplotlib)')
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    defaults = {
+        'seed': args.seed,
+        'method': args.method,
+        'time_limit': args.time_limit,
+        'backend': args.backend,
+        'heuristics': args.heuristics,
+        'board': not args.no_board or args.plot or args.save is not None,
+    }
+    jobs = []
+    if args.N is not None:
+        jobs.append(dict(defaults, N=args.N))
+    jobs.extend(parse_job_or_error(text, defaults) for text in args.job)
+    if not jobs:
+        jobs = read_jobs(sys.stdin, defaults)
+    for i, job in enumerate(jobs):
+        job['index'] = i
+
+    solved = []
+    store = BoardFile(args.save) if args.save else None
+    if args.jobs > 1 and len(jobs) > 1:
+        with Pool(args.jobs) as pool:
+            results = pool.imap_unordered(run_job, jobs)
+            failures = emit(results, args, solved, store)
+    else:
+        failures = emit(map(run_job, jobs), args, solved, store)
+
+    if args.plot:
+        for record in solved:
+            Board(record['N']).display_board(record['board'], f"{record['method']} (N={record['N']})")
+    return 1 if failures else 0
+
+
+def emit(results: Iterable[dict], args: argparse.Namespace, solved: List[dict],
+         store: Optional[BoardFile] = None) -> int:
+    #stream each record as soon as its job completes
+    failures = 0
+    for record in results:
+        if not record.get('success'):
+            failures += 1
+        else:
+            if store is not None:
+                record['saved'] = store.append(record['board'], solver=record['method'],
+                                               seed=record['seed'], conflicts=record.get('conflicts', 0))
+            if args.plot:
+                solved.append(record)
+        if args.no_board and 'board' in record:
+            record = {k: v for k, v in record.items() if k != 'board'}
+        sys.stdout.write(json.dumps(record) + '\n')
+        sys.stdout.flush()
+    return failures
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,57 @@
+import time
+from typing import List, Optional, Tuple
+
+from .board import Board
+
+
+class Constructive:
+    #Explicit solution for any N >= 4 (and N = 1), no search.
+    #With rows numbered 1..N: list the even rows, then the odd rows, with two fix-ups by N mod 6:
+    #  N mod 6 == 2 -> swap 1 and 3 in the odd rows and move 5 to the end
+    #  N mod 6 == 3 -> move 2 to the end of the even rows and 1, 3 to the end of the odd rows
+    def __init__(self, board: Board):
+        self.board = board
+
+    #O(N)
+    @staticmethod
+    def fill(board) -> bool:
+        #writes the solution into an existing list / array('i') / ndarray of length N in place
+        N = len(board)
+        if N in (2, 3):
+            return False
+        if N == 1:
+            board[0] = 0
+            return True
+
+        evens = list(range(2, N + 1, 2))
+        odds = list(range(1, N + 1, 2))
+        if N % 6 == 2:
+            odds[0], odds[1] = 3, 1
+            odds.remove(5)
+            odds.append(5)
+        elif N % 6 == 3:
+            evens.remove(2)
+            evens.append(2)
+            odds = odds[2:] + [1, 3]
+
+        c = 0
+        for rows in (evens, odds):
+            for r in rows:
+                #back to 0-based rows
+                board[c] = r - 1
+                c += 1
+        return True
+
+    @staticmethod
+    def construct(N: int) -> Optional[List[int]]:
+        board = [0] * N
+        return board if Constructive.fill(board) else None
+
+    def constructive_auto(self) -> Tuple[Optional[List[int]], dict]:
+        N = self.board.N
+        start_time = time.time()
+        sol = self.construct(N)
+        if sol is None:
+            #no placement exists for N = 2, 3
+            return None, {'success': False, 'steps': 0, 'runtime': time.time() - start_time}
+        return sol, {'success': True, 'conflicts': 0, 'steps': 0, 'runtime': time.time() - start_time}
@@ -0,0 +1,847 @@
+import heapq
+import random
+import time
+from typing import Dict, Generator, List, Optional, Tuple
+
+from .board import ConflictCounter, pinned_rows
+from .checkpoint import Checkpointer, load_checkpoint
+from .profiling import Profiler
+from .step_events import StepEvent
+
+
+class CSP:
+    #backend: 'sets' (dict of Python sets, copied on every node) or
+    #'bitmask' (integer bitmasks with undo-on-backtrack, no copying)
+    BACKENDS = ('sets', 'bitmask')
+    #heuristics: 'scan' (MRV / LCV recomputed from the domains on every node) or
+    #'incremental' (MRV heap + LCV support counts updated while pruning; bitmask backend only)
+    HEURISTICS = ('scan', 'incremental')
+
+    #profiler: optional Profiler; adds per-phase timers / counters as stats['profile']
+    def __init__(self, board, backend: str = 'sets', profiler: Optional[Profiler] = None, heuristics: str = 'scan'):
+        if backend not in self.BACKENDS:
+            raise ValueError(f"Unknown CSP backend {backend!r}, expected one of {self.BACKENDS}")
+        if heuristics not in self.HEURISTICS:
+            raise ValueError(f"Unknown CSP heuristics {heuristics!r}, expected one of {self.HEURISTICS}")
+        if heuristics == 'incremental' and backend != 'bitmask':
+            raise ValueError("Incremental heuristics require backend='bitmask'")
+        self.board = board
+        self.backend = backend
+        self.profiler = profiler
+        self.heuristics = heuristics
+
+    @staticmethod
+    def is_consistent(col, row, assignment_local):
+        #This checks if placing a queen in column 'col' at row 'row' is valid, given the queens already placed in assignment_local
+        for c, r in assignment_local.items():
+            #row or diagonal conflict
+            if r == row or abs(c - col) == abs(r - row):
+                return False
+        return True
+
+    #Variable Selection (MRV heuristic)
+    #Selects which variable (column) to assign next.
+    @staticmethod
+    def select_unassigned(domains_local, assignment_local):
+        candidates = []
+        for c in domains_local:
+            if c not in assignment_local:
+                candidates.append((len(domains_local[c]), c))
+        #Sorts by domain size — columns with fewer possible rows come first
+        candidates.sort()
+        #Picks the column with smallest domain (most constrained variable).
+        #Instead of degree heuristic it picks the first after sorting  ---> it makes no special difference for values of N from N=4 to N=64
+        return candidates[0][1]
+
+    #Value Ordering (LCV heuristic)
+    @staticmethod
+    def order_values(col, domains_local, assignment_local):
+        def impact(row_val):
+            removed = 0
+            for c in domains_local:
+                #continue if already assigned
+                if c in assignment_local or c == col:
+                    continue
+                for other_row_val in list(domains_local[c]):
+                    #Count how many would be eliminated to measure impact (same row or diagonal conflict).
+                    if other_row_val == row_val or abs(c - col) == abs(other_row_val - row_val):
+                        removed += 1
+            return removed
+
+        vals = list(domains_local[col])
+        #Sort possible row values so the least restrictive (smallest impact) comes first.
+        vals.sort(key=lambda x: impact(x))
+        return vals
+
+    #constraint propagation
+    @staticmethod
+    def forward_check(col, row, domains_local, N, assignment_local):
+        #make a copy
+        new_domains = {c: set(domains_local[c]) for c in domains_local}
+        for c in new_domains:
+            #For the current variable (col), fix its domain to {row}
+            if c == col:
+                new_domains[c] = {row}
+                continue
+            #prune the domain of other cols ---> propagate the constraint
+            #row-constraint
+            if row in new_domains[c]:
+                new_domains[c].remove(row)
+
+            #diagonal-constraint
+            #for the current placed queen (col, row):
+            #/ diagonal: all positions where r + c == row + col
+            #\ diagonal: all positions where r - c == row - col
+            #So the two possible diagonally attacked rows in column col are
+            diag1 = row + (c - col)
+            diag2 = row - (c - col)
+            for dc in (diag1, diag2):
+                #if in bounds and not already pruned
+                if 0 <= dc < N and dc in new_domains[c]:
+                    new_domains[c].remove(dc)
+            #If any unassigned column loses all possible rows → contradiction.
+            #Return None → signal backtrack needed.
+            if len(new_domains[c]) == 0 and c not in assignment_local:
+                return None
+        return new_domains
+
+
+    #The four search phases as plain callables; timed / counting wrappers when profiling.
+    def phases(self):
+        select_unassigned = self.select_unassigned
+        order_values = self.order_values
+        is_consistent = self.is_consistent
+        forward_check = self.forward_check
+        prof = self.profiler
+        if prof is None:
+            return select_unassigned, order_values, is_consistent, forward_check
+
+        timed_forward_check = prof.wrap('forward_check', forward_check)
+
+        def counted_forward_check(col, row, domains_local, N, assignment_local):
+            new_domains = timed_forward_check(col, row, domains_local, N, assignment_local)
+            if new_domains is None:
+                prof.count('wipeouts')
+            else:
+                #values removed from the other columns' domains, as BitmaskDomains counts them (col's own
+                #domain shrinking to {row} is not pruning)
+                prof.count('pruned', sum(len(domains_local[c]) - len(d) for c, d in new_domains.items() if c != col))
+            return new_domains
+
+        return (prof.wrap('select_unassigned', select_unassigned), prof.wrap('order_values', order_values),
+                prof.wrap('is_consistent', is_consistent), counted_forward_check)
+
+    def _finish(self, stats: dict) -> dict:
+        if self.profiler is not None:
+            self.profiler.finish(stats)
+        return stats
+
+    def domain_state(self, reset_profiler: bool = True):
+        #search state of the selected backend, driven by search(). Called at the start of each
+        #solve, so the profiler is reset here before the phases are wrapped (repair rounds after
+        #the first keep counting into the same report)
+        if self.profiler is not None and reset_profiler:
+            self.profiler.reset()
+        if self.heuristics == 'incremental':
+            return IncrementalDomains(self.board.N, self.profiler)
+        if self.backend == 'bitmask':
+            return BitmaskDomains(self.board.N, self.profiler)
+        return SetDomains(self.board.N, self.phases())
+
+    # --- Search engine (explicit stack) ---
+    #Depth-first MRV/LCV search without recursion: one frame [col, ordered values, next index]
+    #per assigned column, and the domain state undoes its own pruning on unassign.
+    #Yields ('assign', col, row) / ('backtrack', col, row) as it goes; state.steps counts
+    #search nodes exactly like the recursive backtrack() calls did.
+    #The stack only removes the recursion-depth limit; it does not bound backtracking. Per node,
+    #'scan' costs O(N^2) bit operations (and 'sets' much more), 'incremental' O(N) amortised, but
+    #some sizes still need millions of nodes with either (N=200, 1000 and 2000 time out after 30 s,
+    #N=500 solves in 518 nodes), so large N is a job for MinConflicts / Constructive.
+    #hints: optional board whose row for a column is tried first (warm start, see csp_repair).
+    #checkpointer: saves the frames at node boundaries when due and before a timeout; frames: the
+    #saved frames of a resumed search, whose assignments are already replayed into state.
+    def search(self, state, time_limit: Optional[float], start_time: float,
+               hints: Optional[List[int]] = None, checkpointer: Optional[Checkpointer] = None,
+               frames: Optional[list] = None) -> Generator[Tuple[str, int, int], None, None]:
+        N = state.N
+        prof = self.profiler
+        frames = [] if frames is None else frames
+        descend = True
+        while True:
+            if descend:
+                if checkpointer is not None and checkpointer.due():
+                    checkpointer.save(steps=state.steps, frames=frames)
+                state.steps += 1
+                if prof is not None:
+                    prof.peak('max_depth', state.assigned)
+                if time_limit and (time.time() - start_time) > time_limit:
+                    if checkpointer is not None:
+                        checkpointer.save(steps=state.steps - 1, frames=frames)
+                    raise TimeoutError('CSP time limit exceeded')
+                #If all columns assigned, we found a valid complete solution
+                if state.assigned == N:
+                    return
+                col = state.select_unassigned()
+                vals = state.order_values(col)
+                if hints is not None and hints[col] in vals:
+                    vals.remove(hints[col])
+                    vals.insert(0, hints[col])
+                frames.append([col, vals, 0])
+                descend = False
+
+            frame = frames[-1]
+            col, vals, i = frame
+            while i < len(vals):
+                row_val = vals[i]
+                i += 1
+                if state.assign(col, row_val):
+                    frame[2] = i
+                    yield ('assign', col, row_val)
+                    descend = True
+                    break
+            if descend:
+                continue
+
+            #no value left for col: backtrack into the column assigned before it
+            frames.pop()
+            if not frames:
+                return
+            parent = frames[-1][0]
+            parent_row = state.unassign(parent)
+            if prof is not None:
+                prof.count('backtracks')
+            yield ('backtrack', parent, parent_row)
+
+    # --- Auto Solver ---
+    #checkpoint: path of a checkpoint file written every checkpoint_every seconds (see
+    #checkpoint.Checkpointer) and on timeout; resume() continues from it. Removed once solved or
+    #exhausted.
+    def csp_auto(self, time_limit: Optional[float] = 10.0, checkpoint: Optional[str] = None,
+                 checkpoint_every: float = 30.0) -> Tuple[Optional[List[int]], dict]:
+        start_time = time.time()
+        state = self.domain_state()
+        return self._solve(state, time_limit, start_time, self._checkpointer(checkpoint, checkpoint_every))
+
+    # --- Warm-start repair ---
+    #Local repair after a few queens moved or were pinned. The columns attacked on the pinned board
+    #(the core) are unassigned; every other queen stays as a hard assignment (state.fix), so the
+    #search runs over the free columns and the rows / diagonals the fixed queens leave open, trying
+    #each column's old row first. A round that finds nothing within its node budget (64 per free
+    #column + 256) frees the core plus a new sample of the fixed queens that block it, the sample
+    #doubling every WIDEN_TRIES rounds; once that covers every unpinned column, the last round is the
+    #full search without a budget. Pinned columns are never unassigned.
+    WIDEN_TRIES = 4
+
+    def csp_repair(self, board: List[int], pinned=None, time_limit: Optional[float] = 10.0,
+                   checkpoint: Optional[str] = None, checkpoint_every: float = 30.0) -> Tuple[Optional[List[int]], dict]:
+        N = self.board.N
+        if len(board) != N:
+            raise ValueError(f"Expected a board of {N} columns, got {len(board)}")
+        pins = pinned_rows(pinned, N)
+        start_time = time.time()
+        hints, core = self._repair_core(board, pins)
+        checkpointer = self._checkpointer(checkpoint, checkpoint_every, pins, list(board))
+        return self._repair(list(board), hints, pins, core, core, time_limit, start_time, checkpointer)
+
+    #the pinned board and its attacked unpinned columns
+    @staticmethod
+    def _repair_core(board: List[int], pins: dict) -> Tuple[List[int], List[int]]:
+        hints = list(board)
+        for col, row in pins.items():
+            hints[col] = row
+        counter = ConflictCounter(hints)
+        return hints, [c for c in range(len(hints)) if c not in pins and counter.attacked(c)]
+
+    #free set of repair round 'rounds' (> 1): the core plus a seeded sample of the fixed queens
+    #blocking the most (core column, open row) cells on a diagonal, drawn from twice as many
+    #candidates and topped up at random, so retries at one size free different queens
+    @classmethod
+    def _widen(cls, hints: List[int], core: List[int], pins: dict, rounds: int) -> List[int]:
+        N = len(hints)
+        size = max(4, len(core)) * 2 ** ((rounds - 1) // cls.WIDEN_TRIES)
+        if len(core) + size + len(pins) >= N - 1:
+            return [c for c in range(N) if c not in pins]
+        rng = random.Random(rounds)
+        core_set = set(core)
+        main_owner, anti_owner = {}, {}
+        open_rows = set(range(N))
+        for c in range(N):
+            if c not in core_set:
+                r = hints[c]
+                open_rows.discard(r)
+                main_owner[r - c] = c
+                anti_owner[r + c] = c
+        blocking = {}
+        for c in core:
+            for r in open_rows:
+                for owner in (main_owner.get(r - c), anti_owner.get(r + c)):
+                    if owner is not None and owner not in pins:
+                        blocking[owner] = blocking.get(owner, 0) + 1
+        candidates = sorted(blocking, key=lambda c: (-blocking[c], c))[:2 * size]
+        added = set(rng.sample(candidates, min(size, len(candidates))))
+        if len(added) < size:
+            rest = [c for c in range(N) if c not in core_set and c not in pins and c not in added]
+            added.update(rng.sample(rest, size - len(added)))
+        return sorted(core_set | added)
+
+    #repair rounds from 'free' on; state / frames / round_start / rounds continue a resumed round
+    def _repair(self, board: List[int], hints: List[int], pins: dict, core: List[int], free: List[int],
+                time_limit: Optional[float], start_time: float, checkpointer: Optional[Checkpointer] = None,
+                state=None, frames: Optional[list] = None, round_start: int = 0, rounds: int = 1,
+                runtime: float = 0.0) -> Tuple[Optional[List[int]], dict]:
+        N = self.board.N
+        steps = round_start
+        while True:
+            last = len(free) + len(pins) >= N
+            fixed_ok = True
+            if state is None:
+                state = self.domain_state(reset_profiler=rounds == 1)
+                state.steps = steps
+                free_set = set(free)
+                fixed_ok = state.fix({c: hints[c] for c in range(N) if c not in free_set})
+            if checkpointer is not None:
+                checkpointer.context.update(free=free, round_start=round_start, rounds=rounds)
+            budget = None if last else 64 * len(free) + 256
+            if fixed_ok:
+                search = self.search(state, time_limit, start_time, hints, checkpointer, frames)
+                try:
+                    for _ in search:
+                        if budget is not None and state.steps - round_start > budget:
+                            break
+                except TimeoutError:
+                    stats = {'success': False, 'steps': state.steps, 'pinned': len(pins), 'rounds': rounds,
+                             'runtime': time.time() - start_time + runtime, 'timeout': True}
+                    if checkpointer is not None:
+                        stats['checkpoint'] = checkpointer.path
+                    return None, self._finish(stats)
+                finally:
+                    search.close()
+                if state.assigned == N:
+                    if checkpointer is not None:
+                        checkpointer.clear()
+                    solution = state.solution()
+                    return solution, self._finish({
+                        'success': True,
+                        'steps': state.steps,
+                        'pinned': len(pins),
+                        'rounds': rounds,
+                        'freed': len(free),
+                        'changed': sum(1 for c in range(N) if solution[c] != board[c]),
+                        'runtime': time.time() - start_time + runtime
+                    })
+            steps = state.steps
+            if last:
+                #no solution extends the pins
+                if checkpointer is not None:
+                    checkpointer.clear()
+                return None, self._finish({'success': False, 'steps': steps, 'pinned': len(pins), 'rounds': rounds,
+                                           'runtime': time.time() - start_time + runtime})
+            rounds += 1
+            free = self._widen(hints, core, pins, rounds)
+            state, frames, round_start = None, None, steps
+
+    # --- Resume ---
+    #Continue a csp_auto / csp_repair search from its last checkpoint. The domain trail is not
+    #stored: the fixed queens of the repair round and each frame's chosen value are re-assigned
+    #in order, which rebuilds the same domains (and heuristic counts), so the search goes on
+    #exactly as if uninterrupted. time_limit counts from the resume; stats['runtime'] is cumulative.
+    def resume(self, checkpoint: str, time_limit: Optional[float] = 10.0,
+               checkpoint_every: float = 30.0) -> Tuple[Optional[List[int]], dict]:
+        data = load_checkpoint(checkpoint, 'csp')
+        N = self.board.N
+        if (data['N'], data['backend'], data['heuristics']) != (N, self.backend, self.heuristics):
+            raise ValueError(f"Checkpoint is for N={data['N']}, backend={data['backend']!r}, "
+                             f"heuristics={data['heuristics']!r}; this CSP is N={N}, "
+                             f"backend={self.backend!r}, heuristics={self.heuristics!r}")
+        start_time = time.time()
+        state = self.domain_state()
+        board = data['board']
+        pins = {c: r for c, r in data['pinned']}
+        if board is not None:
+            hints, core = self._repair_core(board, pins)
+            free_set = set(data['free'])
+            if not state.fix({c: hints[c] for c in range(N) if c not in free_set}):
+                raise ValueError(f"Corrupt checkpoint {checkpoint}: fixed queens cannot be replayed")
+        for col, vals, i in data['frames']:
+            if not 0 < i <= len(vals) or not state.assign(col, vals[i - 1]):
+                raise ValueError(f"Corrupt checkpoint {checkpoint}: column {col} cannot be replayed")
+        state.steps = data['steps']
+        checkpointer = self._checkpointer(checkpoint, checkpoint_every, pins, board, data['runtime'])
+        if board is None:
+            return self._solve(state, time_limit, start_time, checkpointer, data['frames'], data['runtime'])
+        return self._repair(board, hints, pins, core, data['free'], time_limit, start_time, checkpointer, state,
+                            data['frames'], data['round_start'], data['rounds'], data['runtime'])
+
+    def _checkpointer(self, path: Optional[str], interval: float, pins: Optional[dict] = None,
+                      board: Optional[List[int]] = None, runtime: float = 0.0) -> Optional[Checkpointer]:
+        #board: the csp_repair input (None for csp_auto); repair rounds add free / round_start / rounds
+        if path is None:
+            return None
+        context = {
+            'kind': 'csp',
+            'N': self.board.N,
+            'backend': self.backend,
+            'heuristics': self.heuristics,
+            'pinned': sorted(pins.items()) if pins else [],
+            'board': board
+        }
+        return Checkpointer(path, interval, context=context, runtime=runtime)
+
+    #run (or continue) a csp_auto search to the end
+    def _solve(self, state, time_limit: Optional[float], start_time: float,
+               checkpointer: Optional[Checkpointer] = None, frames: Optional[list] = None,
+               runtime: float = 0.0) -> Tuple[Optional[List[int]], dict]:
+        try:
+            for _ in self.search(state, time_limit, start_time, None, checkpointer, frames):
+                pass
+        except TimeoutError:
+            stats = {'success': False, 'steps': state.steps, 'runtime': time.time() - start_time + runtime,
+                     'timeout': True}
+            if checkpointer is not None:
+                stats['checkpoint'] = checkpointer.path
+            return None, self._finish(stats)
+
+        runtime += time.time() - start_time
+        #solved or exhausted: either way there is nothing left to resume
+        if checkpointer is not None:
+            checkpointer.clear()
+        if state.assigned < state.N:
+            return None, self._finish({'success': False, 'steps': state.steps, 'runtime': runtime})
+        return state.solution(), self._finish({'success': True, 'steps': state.steps, 'runtime': runtime})
+
+    # --- Step Solver (Generator) ---
+    def csp_step(self, time_limit: Optional[float] = float('inf')) -> Generator[Tuple[Optional[List[int]], dict], None, None]:
+        N = self.board.N
+        start_time = time.time()
+        state = self.domain_state()
+        #partial board kept in sync with the search; -1 = unassigned
+        partial = [-1] * N
+        try:
+            for kind, col, row_val in self.search(state, time_limit, start_time):
+                stats = {
+                    'success': False,
+                    'steps': state.steps,
+                    'runtime': time.time() - start_time,
+                    'assigned': state.assigned
+                }
+                if kind == 'assign':
+                    partial[col] = row_val
+                else:
+                    partial[col] = -1
+                    stats['backtracked'] = True
+                yield (list(partial), stats)
+        except TimeoutError:
+            yield (None, {
+                'success': False,
+                'steps': state.steps,
+                'runtime': time.time() - start_time,
+                'timeout': True
+            })
+            return
+
+        if state.assigned == N:
+            yield (state.solution(), {
+                'success': True,
+                'steps': state.steps,
+                'runtime': time.time() - start_time
+            })
+            return
+        yield (None, {'success': False, 'steps': state.steps, 'runtime': time.time() - start_time})
+
+    # --- Event-stream Solver (Generator) ---
+    #Same search as csp_step, but yields one reused StepEvent per assign / backtrack
+    #(every k-th of them with every=k) carrying only the changed columns.
+    def csp_events(self, time_limit: Optional[float] = float('inf'), every: int = 1) -> Generator[StepEvent, None, None]:
+        N = self.board.N
+        start_time = time.time()
+        state = self.domain_state()
+        every = max(1, every)
+        raw_events = 0
+        event = StepEvent()
+        try:
+            for kind, col, row_val in self.search(state, time_limit, start_time):
+                raw_events += 1
+                if kind == 'assign':
+                    event.col, event.old_row, event.new_row = col, -1, row_val
+                    event.changes[col] = row_val
+                else:
+                    event.col, event.old_row, event.new_row = col, row_val, -1
+                    event.changes[col] = -1
+                if raw_events % every == 0:
+                    event.kind = kind
+                    event.step = state.steps
+                    event.assigned = state.assigned
+                    event.runtime = time.time() - start_time
+                    yield event
+                    event.clear()
+            event.kind = 'solved' if state.assigned == N else 'failed'
+        except TimeoutError:
+            event.kind = 'timeout'
+        event.step = state.steps
+        event.assigned = state.assigned
+        event.runtime = time.time() - start_time
+        yield event
+
+
+class SetDomains:
+    #Domain state for the 'sets' backend: dict of row sets per column, copied by
+    #forward_check on every assignment and kept on a stack (one level per assigned column).
+    def __init__(self, N: int, phases):
+        self.N = N
+        self.steps = 0
+        self.select, self.order, self.consistent, self.forward = phases
+        #Represents the possible positions of the queen in each column before pruning.
+        self.domains = [{c: set(range(N)) for c in range(N)}]
+        #Tracks current partial solution.
+        self.assignment = {}
+
+    @property
+    def assigned(self) -> int:
+        return len(self.assignment)
+
+    def select_unassigned(self) -> int:
+        return self.select(self.domains[-1], self.assignment)
+
+    def order_values(self, col: int) -> List[int]:
+        return self.order(col, self.domains[-1], self.assignment)
+
+    def assign(self, col: int, row: int) -> bool:
+        if not self.consistent(col, row, self.assignment):
+            return False
+        new_domains = self.forward(col, row, self.domains[-1], self.N, self.assignment)
+        if new_domains is None:
+            return False
+        self.assignment[col] = row
+        self.domains.append(new_domains)
+        return True
+
+    def fix(self, fixed: Dict[int, int]) -> bool:
+        #hard-assign non-attacking queens in bulk (csp_repair); False if a free column has no row left
+        N = self.N
+        rows = set(fixed.values())
+        main = {r - c for c, r in fixed.items()}
+        anti = {r + c for c, r in fixed.items()}
+        domains = {}
+        for c in range(N):
+            if c in fixed:
+                domains[c] = {fixed[c]}
+                continue
+            domains[c] = {r for r in range(N) if r not in rows and r - c not in main and r + c not in anti}
+            if not domains[c]:
+                return False
+        self.domains = [domains]
+        self.assignment = dict(fixed)
+        return True
+
+    def unassign(self, col: int) -> int:
+        self.domains.pop()
+        return self.assignment.pop(col)
+
+    def solution(self) -> List[int]:
+        #converting to a simple list that represent the board
+        return [self.assignment[c] for c in range(self.N)]
+
+
+class BitmaskDomains:
+    #Domain state for the 'bitmask' backend: domains[c] is an int whose bit r is set if row r
+    #is still allowed in column c. Pruning is recorded on a trail and undone on unassign
+    #instead of copying all domains on every node.
+    def __init__(self, N: int, profiler: Optional[Profiler] = None):
+        self.N = N
+        self.steps = 0
+        self.assigned = 0
+        self.domains = [(1 << N) - 1] * N
+        self.assignment = [-1] * N
+        #columns the search may assign: all of them, or the free ones after fix()
+        self.columns = range(N)
+        #occupancy: bit r of row_mask, bit r - c + N of main_mask, bit r + c of anti_mask
+        self.row_mask = self.main_mask = self.anti_mask = 0
+        #(col, old_domain) pairs, popped back to the mark of each assignment
+        self.trail = []
+        self.marks = []
+        self.profiler = profiler
+        if profiler is not None:
+            self.select_unassigned = profiler.wrap('select_unassigned', self.select_unassigned)
+            self.order_values = profiler.wrap('order_values', self.order_values)
+            self.timed_forward_check = profiler.wrap('forward_check', self.forward_check)
+
+    #bits of column c attacked by a queen at (col, row): same row and both diagonals
+    @staticmethod
+    def attacks(c: int, col: int, row: int) -> int:
+        d = abs(c - col)
+        mask = (1 << row) | (1 << (row + d))
+        if row >= d:
+            mask |= 1 << (row - d)
+        return mask
+
+    #MRV via popcount, ties broken by lowest column like CSP.select_unassigned
+    def select_unassigned(self) -> int:
+        domains, assignment = self.domains, self.assignment
+        best, best_size = -1, self.N + 1
+        for c in self.columns:
+            if assignment[c] < 0:
+                size = domains[c].bit_count()
+                if size < best_size:
+                    best, best_size = c, size
+        return best
+
+    #LCV: number of values each row would remove from the other unassigned domains
+    def order_values(self, col: int) -> List[int]:
+        domains, assignment, attacks = self.domains, self.assignment, self.attacks
+        vals = []
+        dom = domains[col]
+        while dom:
+            low = dom & -dom
+            vals.append(low.bit_length() - 1)
+            dom ^= low
+
+        def impact(row_val):
+            removed = 0
+            for c in self.columns:
+                if c != col and assignment[c] < 0:
+                    removed += (domains[c] & attacks(c, col, row_val)).bit_count()
+            return removed
+        vals.sort(key=impact)
+        return vals
+
+    #prune in place; returns False (with the trail already undone) on a domain wipe-out
+    def forward_check(self, col: int, row: int) -> bool:
+        domains, assignment, trail = self.domains, self.assignment, self.trail
+        mark = len(trail)
+        trail.append((col, domains[col]))
+        domains[col] = 1 << row
+        for c in self.columns:
+            if c == col or assignment[c] >= 0:
+                continue
+            mask = self.attacks(c, col, row)
+            if domains[c] & mask:
+                trail.append((c, domains[c]))
+                domains[c] &= ~mask
+                if domains[c] == 0:
+                    self.undo(mark)
+                    return False
+        return True
+
+    def counted_forward_check(self, col: int, row: int) -> bool:
+        mark = len(self.trail)
+        ok = self.timed_forward_check(col, row)
+        if not ok:
+            self.profiler.count('wipeouts')
+        else:
+            #values removed from the other columns (trail[mark] is col's own domain)
+            domains = self.domains
+            self.profiler.count('pruned', sum(dom.bit_count() - domains[c].bit_count() for c, dom in self.trail[mark + 1:]))
+        return ok
+
+    def undo(self, mark: int) -> None:
+        trail, domains = self.trail, self.domains
+        while len(trail) > mark:
+            c, dom = trail.pop()
+            domains[c] = dom
+
+    def assign(self, col: int, row: int) -> bool:
+        row_bit = 1 << row
+        main_bit = 1 << (row - col + self.N)
+        anti_bit = 1 << (row + col)
+        #O(1) consistency check against the occupancy masks
+        if self.row_mask & row_bit or self.main_mask & main_bit or self.anti_mask & anti_bit:
+            return False
+        mark = len(self.trail)
+        ok = self.forward_check(col, row) if self.profiler is None else self.counted_forward_check(col, row)
+        if not ok:
+            return False
+        self.assignment[col] = row
+        self.row_mask |= row_bit
+        self.main_mask |= main_bit
+        self.anti_mask |= anti_bit
+        self.marks.append(mark)
+        self.assigned += 1
+        return True
+
+    def fix(self, fixed: Dict[int, int]) -> bool:
+        #hard-assign non-attacking queens in bulk (csp_repair): the same domains as assigning them
+        #one by one, but O(N) big-int work instead of a forward check each. They are never on the
+        #trail, so search() cannot unassign them, and the per-node loops only visit the free
+        #columns. False if a free column has no row left.
+        N = self.N
+        rows, main, anti = bytearray((N + 7) // 8), bytearray((2 * N + 7) // 8), bytearray((2 * N + 7) // 8)
+        for c, r in fixed.items():
+            self.assignment[c] = r
+            self.domains[c] = 1 << r
+            rows[r >> 3] |= 1 << (r & 7)
+            k = r - c + N
+            main[k >> 3] |= 1 << (k & 7)
+            k = r + c
+            anti[k >> 3] |= 1 << (k & 7)
+        self.row_mask = int.from_bytes(rows, 'little')
+        self.main_mask = int.from_bytes(main, 'little')
+        self.anti_mask = int.from_bytes(anti, 'little')
+        self.assigned = len(fixed)
+        self.columns = [c for c in range(N) if c not in fixed]
+        full = (1 << N) - 1
+        ok = True
+        for c in self.columns:
+            #bit r of main_mask >> (N - c) is diagonal r - c + N, of anti_mask >> c diagonal r + c
+            self.domains[c] = full & ~(self.row_mask | (self.main_mask >> (N - c)) | (self.anti_mask >> c))
+            if self.domains[c] == 0:
+                ok = False
+        return ok
+
+    def unassign(self, col: int) -> int:
+        #clear the queen and restore the pruned domains
+        row = self.assignment[col]
+        self.assignment[col] = -1
+        self.row_mask ^= 1 << row
+        self.main_mask ^= 1 << (row - col + self.N)
+        self.anti_mask ^= 1 << (row + col)
+        self.undo(self.marks.pop())
+        self.assigned -= 1
+        return row
+
+    def solution(self) -> List[int]:
+        return list(self.assignment)
+
+
+class IncrementalDomains(BitmaskDomains):
+    #Bitmask domains plus incrementally maintained heuristics ('incremental' heuristic mode):
+    #  MRV: lazy heap of (domain size, col); stale entries are dropped when they reach the top.
+    #  LCV: for every row / main diagonal / anti-diagonal line, the number of live values of
+    #       unassigned columns on it. impact(row) of CSP.order_values is then
+    #       rows[row] + main[row - col + N] + anti[row + col] - 3, since (col, row) itself is the
+    #       only value of col on those three lines.
+    #Both are updated per pruned / restored value, so no domain is rescanned to order the search.
+    def __init__(self, N: int, profiler: Optional[Profiler] = None):
+        super().__init__(N, profiler)
+        self.sizes = [N] * N
+        self.row_support = [N] * N
+        #cells on main diagonal r - c + N and anti-diagonal r + c
+        self.main_support = [N - abs(k - N) for k in range(2 * N)]
+        self.anti_support = [N - abs(k - (N - 1)) for k in range(2 * N)]
+        self.heap = [(N, c) for c in range(N)]
+
+    def _drop(self, c: int, bits: int) -> None:
+        #values 'bits' of column c leave the live pool
+        N = self.N
+        while bits:
+            low = bits & -bits
+            bits ^= low
+            r = low.bit_length() - 1
+            self.row_support[r] -= 1
+            self.main_support[r - c + N] -= 1
+            self.anti_support[r + c] -= 1
+
+    def _restore(self, c: int, bits: int) -> None:
+        N = self.N
+        while bits:
+            low = bits & -bits
+            bits ^= low
+            r = low.bit_length() - 1
+            self.row_support[r] += 1
+            self.main_support[r - c + N] += 1
+            self.anti_support[r + c] += 1
+
+    def fix(self, fixed: Dict[int, int]) -> bool:
+        #bulk hard assignment as in BitmaskDomains, then sizes, support counts and the heap are
+        #rebuilt from the remaining domains
+        ok = super().fix(fixed)
+        N = self.N
+        self.row_support = [0] * N
+        self.main_support = [0] * (2 * N)
+        self.anti_support = [0] * (2 * N)
+        for c in range(N):
+            self.sizes[c] = self.domains[c].bit_count()
+        for c in self.columns:
+            self._restore(c, self.domains[c])
+        self.heap = [(self.sizes[c], c) for c in self.columns]
+        heapq.heapify(self.heap)
+        return ok
+
+    #amortised O(log N)
+    def select_unassigned(self) -> int:
+        heap, sizes, assignment = self.heap, self.sizes, self.assignment
+        if len(heap) > 8 * self.N + 64:
+            #too many stale entries: rebuild from the unassigned columns
+            heap[:] = [(sizes[c], c) for c in self.columns if assignment[c] < 0]
+            heapq.heapify(heap)
+        while True:
+            size, c = heap[0]
+            if assignment[c] < 0 and sizes[c] == size:
+                return c
+            heapq.heappop(heap)
+
+    #O(d log d) for a domain of d values
+    def order_values(self, col: int) -> List[int]:
+        N = self.N
+        rows, main, anti = self.row_support, self.main_support, self.anti_support
+        vals = []
+        dom = self.domains[col]
+        while dom:
+            low = dom & -dom
+            vals.append(low.bit_length() - 1)
+            dom ^= low
+        vals.sort(key=lambda r: rows[r] + main[r - col + N] + anti[r + col])
+        return vals
+
+    def forward_check(self, col: int, row: int) -> bool:
+        domains, assignment, trail, sizes, heap = self.domains, self.assignment, self.trail, self.sizes, self.heap
+        mark = len(trail)
+        trail.append((col, domains[col]))
+        domains[col] = 1 << row
+        sizes[col] = 1
+        for c in self.columns:
+            if c == col or assignment[c] >= 0:
+                continue
+            removed = domains[c] & self.attacks(c, col, row)
+            if removed:
+                trail.append((c, domains[c]))
+                domains[c] ^= removed
+                self._drop(c, removed)
+                sizes[c] = domains[c].bit_count()
+                heapq.heappush(heap, (sizes[c], c))
+                if sizes[c] == 0:
+                    self.undo(mark, col)
+                    return False
+        return True
+
+    def undo(self, mark: int, col: int = -1) -> None:
+        #restores domains (and support counts of the unassigned columns other than col)
+        trail, domains, sizes, heap = self.trail, self.domains, self.sizes, self.heap
+        while len(trail) > mark:
+            c, dom = trail.pop()
+            if c != col:
+                self._restore(c, dom & ~domains[c])
+            domains[c] = dom
+            sizes[c] = dom.bit_count()
+            heapq.heappush(heap, (sizes[c], c))
+
+    def assign(self, col: int, row: int) -> bool:
+        row_bit = 1 << row
+        main_bit = 1 << (row - col + self.N)
+        anti_bit = 1 << (row + col)
+        if self.row_mask & row_bit or self.main_mask & main_bit or self.anti_mask & anti_bit:
+            return False
+        mark = len(self.trail)
+        #col leaves the pool of unassigned columns
+        self._drop(col, self.domains[col])
+        ok = self.forward_check(col, row) if self.profiler is None else self.counted_forward_check(col, row)
+        if not ok:
+            self._restore(col, self.domains[col])
+            return False
+        self.assignment[col] = row
+        self.row_mask |= row_bit
+        self.main_mask |= main_bit
+        self.anti_mask |= anti_bit
+        self.marks.append(mark)
+        self.assigned += 1
+        return True
+
+    def unassign(self, col: int) -> int:
+        row = self.assignment[col]
+        self.assignment[col] = -1
+        self.row_mask ^= 1 << row
+        self.main_mask ^= 1 << (row - col + self.N)
+        self.anti_mask ^= 1 << (row + col)
+        self.undo(self.marks.pop(), col)
+        self._restore(col, self.domains[col])
+        self.assigned -= 1
+        return row
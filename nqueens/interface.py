@@ -1,5 +1,16 @@
+from .board import Board
+from .constructive import Constructive
+from .csp import CSP
+from .local_search import LocalSearch
+from .step_events import BoardReplayer
+
+
 #DRIVER CODE
 def run_interface():
+    #notebook-only dependencies are imported on use, so importing the package stays headless
+    import ipywidgets as widgets
+    from IPython.display import clear_output, display
+
     N_slider = widgets.IntSlider(value=8, min=4, max=64, step=1, description='N:')
     seed_box = widgets.IntText(value=42, description='Seed:')
 
@@ -7,15 +18,35 @@ def run_interface():
     step_ls_btn = widgets.Button(description='Step-Mode (Local Search)', button_style='info')
     auto_csp_btn = widgets.Button(description='Auto-Solve (CSP)', button_style='success')
     step_csp_btn = widgets.Button(description='Step-Mode (CSP)', button_style='info')
+    auto_con_btn = widgets.Button(description='Instant (Constructive)', button_style='success')
 
     next_btn = widgets.Button(description='Next Step', button_style='primary')
     reset_btn = widgets.Button(description='Reset', button_style='warning')
 
     output = widgets.Output()
+    #step mode: one status line above a single reused figure (see render.BoardRenderer)
+    status = widgets.Label()
     next_btn.layout.display = 'none'
-    state = {'iterator': None, 'board_obj': None, 'mode': None}
+    state = {'iterator': None, 'board_obj': None, 'mode': None, 'replayer': None, 'renderer': None, 'full_redraw': False}
+
+    def close_renderer():
+        if state['renderer'] is not None:
+            state['renderer'].close()
+            state['renderer'] = None
+        status.value = ''
+
+    def start_step_view(bo, message):
+        #draw the initial board once; on_next only updates the columns that change
+        from .render import BoardRenderer
+        renderer = BoardRenderer(bo.N)
+        renderer.update(bo.board, title="Initial Board")
+        state['renderer'] = renderer
+        state['full_redraw'] = True
+        status.value = message
+        renderer.show()
 
     def show_initial(N, seed):
+        close_renderer()
         with output:
             clear_output(wait=True)
             bo = Board(N, seed)
@@ -26,6 +57,7 @@ def run_interface():
     show_initial(N_slider.value, seed_box.value)
 
     def on_auto_ls(_):
+        close_renderer()
         with output:
             clear_output(wait=True)
             N = N_slider.value
@@ -45,18 +77,19 @@ def run_interface():
                 bo.display_board(bo.board, "Final Board")
 
     def on_step_ls(_):
+        close_renderer()
         with output:
             clear_output(wait=True)
             N = N_slider.value
             seed = seed_box.value
             bo = Board(N, seed)
             ls = LocalSearch(bo)
-            state.update({'board_obj': bo, 'mode': 'ls', 'iterator': ls.local_search_step(seed=seed)})
+            state.update({'board_obj': bo, 'mode': 'ls', 'iterator': ls.local_search_events(seed=seed), 'replayer': BoardReplayer(N)})
             next_btn.layout.display = ''
-            print(f"Step mode (Local Search) initialized (N={N}, seed={seed}).")
-            bo.display_board(bo.board, "Initial Board")
+            start_step_view(bo, f"Step mode (Local Search) initialized (N={N}, seed={seed}).")
 
     def on_auto_csp(_):
+        close_renderer()
         with output:
             clear_output(wait=True)
             N = N_slider.value
@@ -76,48 +109,67 @@ def run_interface():
                 bo.display_board(bo.board, "CSP Final Board")
 
     def on_step_csp(_):
+        close_renderer()
         with output:
             clear_output(wait=True)
             N = N_slider.value
             seed = seed_box.value
             bo = Board(N, seed)
             csp_obj = CSP(bo)
-            state.update({'board_obj': bo, 'mode': 'csp', 'iterator': csp_obj.csp_step(time_limit=1000)})
+            state.update({'board_obj': bo, 'mode': 'csp', 'iterator': csp_obj.csp_events(time_limit=1000), 'replayer': BoardReplayer(N)})
             next_btn.layout.display = ''
-            print(f"Step mode (CSP) initialized (N={N}, seed={seed}).")
-            bo.display_board(bo.board, "Initial Board")
+            start_step_view(bo, f"Step mode (CSP) initialized (N={N}, seed={seed}).")
+
+    def on_auto_con(_):
+        close_renderer()
+        with output:
+            clear_output(wait=True)
+            N = N_slider.value
+            seed = seed_box.value
+            bo = Board(N, seed)
+            state['board_obj'] = bo
+            #fast path: closed-form placement, no search
+            sol, stats = Constructive(bo).constructive_auto()
+            if sol:
+                print(f"✅ Constructive solution (N={N}), time: {stats['runtime']:.6f}s")
+                bo.display_board(sol, "Constructive Solution")
+            else:
+                print(f"❌ No solution exists for N={N}.")
 
     def on_next(_):
+        if state['renderer'] is None:
+            return
         with output:
             try:
-                item = next(state['iterator'])
+                event = next(state['iterator'])
             except StopIteration:
-                print("Generator exhausted.")
+                status.value = "Generator exhausted."
                 next_btn.layout.display = 'none'
                 return
 
-            board, stats = item
-            clear_output(wait=True)
-            if board is None:
-                print("Search finished without solution.")
-                print(stats)
+            #step mode streams deltas; the figure is redrawn only for the changed columns
+            board = state['replayer'].apply(event)
+            #the first event redraws everything: the step view starts from the random initial board
+            changed = None if event.board is not None or state['full_redraw'] else list(event.changes)
+            state['full_redraw'] = False
+            renderer = state['renderer']
+            if event.kind in ('failed', 'timeout'):
+                status.value = ("Search finished without solution. "
+                                f"Steps: {event.step}, time: {event.runtime:.6f}s" + (" (timeout)" if event.kind == 'timeout' else ""))
                 next_btn.layout.display = 'none'
                 return
 
-            if stats.get('success'):
-                print(f"✅ Solution found. Steps: {stats.get('steps', '?')}, time: {stats.get('runtime', 0):.6f}s")
-                state['board_obj'].display_board(board, "Final Solution")
+            if event.kind == 'solved':
+                status.value = f"✅ Solution found. Steps: {event.step}, time: {event.runtime:.6f}s"
+                renderer.update(board, changed, "Final Solution")
                 next_btn.layout.display = 'none'
-                return
-
-            if state['mode'] == 'csp':
-                print(f"Assigned: {stats.get('assigned', 0)}, Steps: {stats['steps']}, Time: {stats['runtime']:.6f}s")
-                state['board_obj'].display_board(board, "CSP Step (Partial Assignment)")
-                return
-
-            if state['mode'] == 'ls':
-                print(f"Step: {stats['steps']}, Conflicts: {stats['conflicts']}, Temp: {stats['temperature']:.12f}, Restarts: {stats['restarts']}")
-                state['board_obj'].display_board(board, "Local Search Progress")
+            elif state['mode'] == 'csp':
+                status.value = f"Assigned: {event.assigned}, Steps: {event.step}, Time: {event.runtime:.6f}s"
+                renderer.update(board, changed, "CSP Step (Partial Assignment)")
+            else:
+                status.value = f"Step: {event.step}, Conflicts: {event.conflicts}, Temp: {event.temperature:.12f}, Restarts: {event.restarts}"
+                renderer.update(board, changed, "Local Search Progress")
+            renderer.show()
 
     def on_reset(_):
         next_btn.layout.display = 'none'
@@ -129,16 +181,13 @@ def run_interface():
     step_ls_btn.on_click(on_step_ls)
     auto_csp_btn.on_click(on_auto_csp)
     step_csp_btn.on_click(on_step_csp)
+    auto_con_btn.on_click(on_auto_con)
     next_btn.on_click(on_next)
     reset_btn.on_click(on_reset)
 
     controls = widgets.VBox([
         widgets.HBox([N_slider, seed_box]),
-        widgets.HBox([auto_ls_btn, step_ls_btn, auto_csp_btn, step_csp_btn, next_btn, reset_btn])
+        widgets.HBox([auto_ls_btn, step_ls_btn, auto_csp_btn, step_csp_btn, auto_con_btn, next_btn, reset_btn])
     ])
-    ui = widgets.VBox([controls, widgets.HTML('<hr/>'), output])
+    ui = widgets.VBox([controls, widgets.HTML('<hr/>'), status, output])
     display(ui)
-
-
-
-run_interface()
@@ -0,0 +1,433 @@
+import math
+import random
+import time
+from time import perf_counter
+from typing import Generator, List, Optional, Tuple, Union
+
+from .board import Board, ConflictCounter, pinned_rows
+from .checkpoint import Checkpointer, load_checkpoint, rng_state, set_rng_state
+from .profiling import Profiler
+from .step_events import StepEvent
+from .tuning import schedule_for
+
+
+class LocalSearch:
+    #profiler: optional Profiler; adds select_move / evaluate_delta timers and accept / reject
+    #counters as stats['profile']
+    #profile: tuning profile (path or dict, see tuning.Tuner); None loads the saved default profile.
+    #self.schedule holds the annealing defaults for this N; explicit keyword arguments override them.
+    def __init__(self, board: Board, profiler: Optional[Profiler] = None, profile: Union[None, str, dict] = None):
+        self.board = board
+        self.profiler = profiler
+        self.schedule = schedule_for(board.N, profile)
+
+    def _local_search_core(
+        self,
+        max_steps:int=100000,
+        restart_limit:Optional[int]=None,
+        initial_temp:Optional[float]=None,
+        stagnation_limit:Optional[int]=None,
+        cooling:Optional[float]=None,
+        seed:Optional[int]=None,
+        initial_board:Optional[List[int]]=None,
+        stream_every:Optional[int]=None,
+        checkpoint:Optional[str]=None,
+        checkpoint_every:float=30.0,
+        resume_state:Optional[dict]=None,
+        copy_boards:bool=False
+    ) -> Generator[Tuple[Optional[List[int]], dict], None, None]:
+        #stream_every=k switches to event-stream mode: yields one reused StepEvent every k-th step
+        #(plus the solved / failed events) instead of a (board, stats) pair per step
+        #checkpoint: path of a checkpoint file (see checkpoint.Checkpointer) written every
+        #checkpoint_every seconds and when the search gives up, removed once solved; resume_state:
+        #a loaded checkpoint to continue from (see resume())
+        #copy_boards: yield a copy of the board per step (step mode, callers may keep the history);
+        #otherwise the yielded list is the search's own board and changes on the next step
+
+        if seed is not None and resume_state is None:
+            random.seed(seed)
+        N = self.board.N
+        restarts = 0
+        #schedule parameters left as None come from the tuning profile for this N
+        schedule = self.schedule
+        restart_limit = schedule['restart_limit'] if restart_limit is None else restart_limit
+        initial_temp = schedule['initial_temp'] if initial_temp is None else initial_temp
+        stagnation_limit = schedule['stagnation_limit'] if stagnation_limit is None else stagnation_limit
+        cooling = schedule['cooling'] if cooling is None else cooling
+        cooling_rate = 1 - cooling / max(1, N)
+        start_time = time.time()
+        checkpointer = None
+        if checkpoint is not None:
+            context = {
+                'kind': 'local_search',
+                'N': N,
+                'max_steps': max_steps,
+                'restart_limit': restart_limit,
+                'initial_temp': initial_temp,
+                'stagnation_limit': stagnation_limit,
+                'cooling': cooling
+            }
+            checkpointer = Checkpointer(checkpoint, checkpoint_every, context=context,
+                                        runtime=resume_state['runtime'] if resume_state is not None else 0.0)
+        #CompactBoard draws restart boards from its own RNG (random.Random or NumPy Generator),
+        #which is checkpointed with the global one
+        board_rng = getattr(self.board, 'rng', None)
+        if resume_state is not None:
+            set_rng_state(resume_state['rng'])
+            if board_rng is not None and resume_state.get('board_rng') is not None:
+                set_rng_state(resume_state['board_rng'], board_rng)
+            restarts = resume_state['restarts']
+            start_time -= resume_state['runtime']
+
+        event = StepEvent() if stream_every else None
+        prof = self.profiler
+        if prof is not None:
+            #stats['profile'] describes this run only
+            prof.reset()
+
+        while restarts <= restart_limit:
+            stagnated = False
+            if resume_state is not None:
+                #the run in progress at the checkpoint
+                steps = resume_state['steps']
+                temperature = resume_state['temperature']
+                current_board = list(resume_state['board'])
+            else:
+                steps = 0
+                temperature = initial_temp
+                #first run may start from a given placement (e.g. Constructive.construct(N)); restarts are random
+                if restarts == 0 and initial_board is not None:
+                    current_board = list(initial_board)
+                else:
+                    current_board = self.board.random_board()
+            #incremental counters: each move is evaluated and applied in O(1), no board copies
+            counter = ConflictCounter(current_board)
+            current_conflicts = counter.conflicts
+            if resume_state is not None:
+                best_conflicts = resume_state['best_conflicts']
+                no_improve = resume_state['no_improve']
+                stagnated = resume_state['stagnated']
+                resume_state = None
+            else:
+                best_conflicts = current_conflicts
+                no_improve = 0
+            if event is not None:
+                #moves of the previous run are superseded by the new board
+                event.clear()
+
+            while steps < max_steps and not stagnated:
+                if current_conflicts == 0 and checkpointer is not None:
+                    checkpointer.clear()
+                # yield current state
+                if event is None:
+                    info = {
+                        'success': current_conflicts == 0,
+                        'conflicts': current_conflicts,
+                        'steps': steps,
+                        'restarts': restarts,
+                        'temperature': temperature,
+                        'runtime': time.time() - start_time
+                    }
+                    if prof is not None and current_conflicts == 0:
+                        prof.count('proposals', steps)
+                        prof.finish(info)
+                    yield (list(current_board) if copy_boards else current_board), info
+                elif current_conflicts == 0 or steps % stream_every == 0:
+                    event.kind = 'solved' if current_conflicts == 0 else 'step'
+                    event.step = steps
+                    event.conflicts = current_conflicts
+                    event.restarts = restarts
+                    event.temperature = temperature
+                    event.runtime = time.time() - start_time
+                    if steps == 0:
+                        event.board = current_board
+                    if prof is not None and current_conflicts == 0:
+                        prof.count('proposals', steps)
+                        prof.finish({})
+                    yield event
+                    event.clear()
+
+                if current_conflicts == 0:
+                    return  # stop generator if solution found
+
+                #every 256 steps at most, so an idle checkpointer costs one comparison per step
+                if checkpointer is not None and not steps & 255 and checkpointer.due():
+                    checkpointer.save(restarts=restarts, steps=steps, temperature=temperature,
+                                      board=[int(r) for r in current_board], best_conflicts=best_conflicts,
+                                      no_improve=no_improve, stagnated=False, rng=rng_state(),
+                                      board_rng=rng_state(board_rng) if board_rng is not None else None)
+
+                if prof is not None:
+                    t0 = perf_counter()
+                # pick a random column and row
+                col = random.randint(0, N-1)
+                new_row = random.randint(0, N-1)
+                while new_row == current_board[col]:
+                    new_row = random.randint(0, N-1)
+                if prof is not None:
+                    t1 = perf_counter()
+                    prof.add_time('select_move', t1 - t0)
+                new_conflicts = current_conflicts + counter.delta(col, new_row)
+                if prof is not None:
+                    prof.add_time('evaluate_delta', perf_counter() - t1)
+
+                delta_e = current_conflicts - new_conflicts
+                if delta_e > 0 or math.exp(delta_e / max(1e-12, temperature)) > random.random():
+                    if prof is not None:
+                        #proposals are counted per run below, rejected = proposals - accepted
+                        prof.count('accepted')
+                        if delta_e < 0:
+                            prof.count('uphill_accepted')
+                    if event is not None:
+                        event.col = col
+                        event.old_row = current_board[col]
+                        event.new_row = new_row
+                        event.changes[col] = new_row
+                    current_conflicts = counter.move(col, new_row)
+
+                if current_conflicts >= best_conflicts:
+                    if temperature < 1e-6:
+                        no_improve += 1
+                        if no_improve >= stagnation_limit:
+                            stagnated = True
+                            break
+                else:
+                    best_conflicts = current_conflicts
+                    no_improve = 0
+
+                temperature *= cooling_rate
+                steps += 1
+
+            if checkpointer is not None and restarts == restart_limit:
+                #giving up: keep the last run so resume() can go on with a larger budget
+                checkpointer.save(restarts=restarts, steps=steps, temperature=temperature,
+                                  board=[int(r) for r in current_board], best_conflicts=best_conflicts,
+                                  no_improve=no_improve, stagnated=stagnated, rng=rng_state(),
+                                  board_rng=rng_state(board_rng) if board_rng is not None else None)
+            restarts += 1
+            if prof is not None:
+                prof.count('proposals', steps)
+            if event is None:
+                yield (list(current_board) if copy_boards else current_board), {'success': False, 'conflicts': current_conflicts, 'steps': steps, 'restarts': restarts, 'restarted': True}
+
+        if event is not None:
+            event.clear()
+            event.kind = 'failed'
+            event.step = steps
+            event.conflicts = current_conflicts
+            event.restarts = restarts
+            event.runtime = time.time() - start_time
+            if prof is not None:
+                prof.finish({})
+            yield event
+            return
+
+        info = {
+            'success': False,
+            'conflicts': current_conflicts,
+            'steps': steps,
+            'restarts': restarts,
+            'runtime': time.time() - start_time
+        }
+        if checkpointer is not None:
+            info['checkpoint'] = checkpointer.path
+        if prof is not None:
+            prof.finish(info)
+        yield None, info
+
+    def local_search_auto(self, **kwargs) -> Tuple[Optional[List[int]], dict]:
+        result = None
+        for board_state, info in self._local_search_core(**kwargs):
+            result = (board_state, info)
+            if info.get('success'):
+                return result
+        return result
+
+    #Continue a local_search_auto(checkpoint=...) run from its last checkpoint: board, counters,
+    #temperature, restart count, schedule and RNG state are restored, so the result is the one the
+    #uninterrupted run would have produced. max_steps / restart_limit may be raised to extend a
+    #run that gave up; stats['runtime'] is cumulative.
+    def resume(self, checkpoint: str, checkpoint_every: float = 30.0, **overrides) -> Tuple[Optional[List[int]], dict]:
+        data = load_checkpoint(checkpoint, 'local_search')
+        if data['N'] != self.board.N:
+            raise ValueError(f"Checkpoint is for N={data['N']}, this board has N={self.board.N}")
+        params = {key: data[key] for key in ('max_steps', 'restart_limit', 'initial_temp', 'stagnation_limit', 'cooling')}
+        for key in overrides:
+            if key not in ('max_steps', 'restart_limit'):
+                raise ValueError(f"Cannot override {key!r} on resume, only max_steps and restart_limit")
+        params.update(overrides)
+        if params['restart_limit'] < data['restarts']:
+            raise ValueError(f"restart_limit must be at least {data['restarts']} (restarts already done)")
+        return self.local_search_auto(checkpoint=checkpoint, checkpoint_every=checkpoint_every,
+                                      resume_state=data, **params)
+
+    def local_search_step(self, **kwargs) -> Generator[Tuple[Optional[List[int]], dict], None, None]:
+        return self._local_search_core(copy_boards=True, **kwargs)
+
+    def local_search_events(self, every: int = 1, **kwargs) -> Generator[StepEvent, None, None]:
+        #O(1) per event: (col, old_row, new_row, conflicts) deltas, rebuild boards with BoardReplayer
+        return self._local_search_core(stream_every=max(1, every), **kwargs)
+
+    #Warm-start repair: conflict-directed moves from an existing board, pinned columns never move.
+    #Only queens that are in conflict are picked (indexed like MinConflicts), and each step takes the
+    #best move of 'picks' of them over their candidate rows: all rows when N <= samples, otherwise up
+    #to 'samples' currently empty rows (where moved queens came from) plus 'samples' random rows.
+    #After the O(N) setup the work therefore grows with the number of conflicts the change
+    #introduced, not with N. Sideways moves are accepted; with probability 'noise' a conflicted
+    #queen takes a random row instead. After 'patience' steps without progress the k-th restart
+    #kicks 2^k random free queens, so the search moves only as far from the board as it has to.
+    def repair(
+        self,
+        board: List[int],
+        pinned=None,
+        max_steps: Optional[int] = None,
+        samples: int = 32,
+        noise: float = 0.05,
+        picks: int = 4,
+        patience: int = 100,
+        restart_limit: int = 50,
+        seed: Optional[int] = None
+    ) -> Tuple[Optional[List[int]], dict]:
+        if seed is not None:
+            random.seed(seed)
+        N = self.board.N
+        if len(board) != N:
+            raise ValueError(f"Expected a board of {N} columns, got {len(board)}")
+        pins = pinned_rows(pinned, N)
+        if max_steps is None:
+            max_steps = 20 * N + 1000
+        rand = random.random
+        start_time = time.time()
+
+        current_board = list(board)
+        for c, r in pins.items():
+            current_board[c] = r
+        counter = ConflictCounter(current_board)
+        attacked = counter.attacked
+        row_counts, main_counts, anti_counts = counter.col_counts, counter.main_diag_counts, counter.anti_diag_counts
+        #index of conflicted free queens; stale entries are dropped when picked and every queen
+        #that lands on a crowded line is added, so each crowded line keeps an indexed queen
+        conflicted = [c for c, r in enumerate(current_board)
+                      if (row_counts[r] > 1 or main_counts[r - c + N] > 1 or anti_counts[r + c] > 1) and c not in pins]
+        where = [-1] * N
+        for k, c in enumerate(conflicted):
+            where[c] = k
+
+        #index of empty rows, same lazy scheme: a row is added when its last queen leaves
+        empty_rows = [r for r, count in enumerate(row_counts) if not count]
+        in_empty = [not count for count in row_counts]
+
+        #column sums per line: on a line with two queens the other one is sum - col, so both sides
+        #of a new conflict are indexed, not just the queen that moved
+        row_sums = [0] * N
+        main_sums = [0] * (2 * N)
+        anti_sums = [0] * (2 * N)
+        for c, r in enumerate(current_board):
+            row_sums[r] += c
+            main_sums[r - c + N] += c
+            anti_sums[r + c] += c
+        lines = ((row_counts, row_sums, 0, 0), (main_counts, main_sums, -1, N), (anti_counts, anti_sums, 1, 0))
+
+        def index(col: int) -> None:
+            if where[col] < 0 and col not in pins:
+                where[col] = len(conflicted)
+                conflicted.append(col)
+
+        def move(col: int, new_row: int) -> int:
+            old_row = current_board[col]
+            conflicts = counter.move(col, new_row)
+            for counts, sums, sign, shift in lines:
+                sums[old_row + sign * col + shift] -= col
+                k = new_row + sign * col + shift
+                sums[k] += col
+                if counts[k] > 1:
+                    index(col)
+                    if counts[k] == 2:
+                        index(sums[k] - col)
+            if row_counts[old_row] == 0 and not in_empty[old_row]:
+                in_empty[old_row] = True
+                empty_rows.append(old_row)
+            return conflicts
+
+        def candidate_rows() -> List[int]:
+            rows = [int(rand() * N) for _ in range(samples)]
+            for _ in range(min(samples, len(empty_rows))):
+                k = int(rand() * len(empty_rows))
+                r = empty_rows[k]
+                if row_counts[r]:
+                    #stale: drop it
+                    empty_rows[k] = empty_rows[-1]
+                    empty_rows.pop()
+                    in_empty[r] = False
+                else:
+                    rows.append(r)
+            return rows
+
+        full_scan = N <= samples
+        conflicts = best_conflicts = counter.conflicts
+        restarts = 0
+        no_improve = 0
+        steps = 0
+        while conflicts > 0 and steps < max_steps and len(pins) < N:
+            if no_improve >= patience:
+                if restarts >= restart_limit:
+                    break
+                restarts += 1
+                for _ in range(min(N, 1 << restarts)):
+                    col = int(rand() * N)
+                    if col not in pins:
+                        conflicts = move(col, int(rand() * N))
+                best_conflicts = conflicts
+                no_improve = 0
+
+            steps += 1
+            no_improve += 1
+            if conflicted and rand() < noise:
+                i = conflicted[int(rand() * len(conflicted))]
+                new_row = int(rand() * N)
+                if new_row == current_board[i]:
+                    continue
+            else:
+                #best move over a few conflicted queens, so a queen whose old row is free again is
+                #moved back before sideways moves of its neighbours drift away from the board
+                best_moves, best_delta = [], 1
+                for _ in range(picks):
+                    if not conflicted:
+                        break
+                    k = int(rand() * len(conflicted))
+                    i = conflicted[k]
+                    if not attacked(i):
+                        last = conflicted.pop()
+                        if last != i:
+                            conflicted[k] = last
+                            where[last] = k
+                        where[i] = -1
+                        continue
+                    old_row = current_board[i]
+                    for r in (range(N) if full_scan else candidate_rows()):
+                        if r == old_row:
+                            continue
+                        d = counter.delta(i, r)
+                        if d < best_delta:
+                            best_moves, best_delta = [(i, r)], d
+                        elif d == best_delta:
+                            best_moves.append((i, r))
+                if not best_moves:
+                    continue
+                i, new_row = best_moves[int(rand() * len(best_moves))]
+
+            conflicts = move(i, new_row)
+            if conflicts < best_conflicts:
+                best_conflicts = conflicts
+                no_improve = 0
+
+        info = {
+            'success': conflicts == 0,
+            'conflicts': conflicts,
+            'steps': steps,
+            'restarts': restarts,
+            'pinned': len(pins),
+            'changed': sum(1 for new, old in zip(current_board, board) if new != old),
+            'runtime': time.time() - start_time
+        }
+        return (current_board if conflicts == 0 else None), info
@@ -0,0 +1,159 @@
+import random
+import time
+from typing import List, Optional, Tuple
+
+from .board import Board
+
+
+class MinConflicts:
+    #Min-conflicts repair on a permutation board (every queen in its own row),
+    #so only diagonal conflicts remain to be repaired. Scales to N = 10^6.
+    def __init__(self, board: Board):
+        self.board = board
+
+    #O(N) expected
+    @staticmethod
+    def greedy_placement(N: int, main_diag_counts: List[int], anti_diag_counts: List[int],
+                         tail: int = 50, max_tries: int = 100) -> List[int]:
+        #Random permutation built column by column: each column draws rows from the unused ones
+        #until it finds one on two free diagonals. The last 'tail' columns (where free rows are rare)
+        #and columns that run out of tries are placed at random and left for the repair phase.
+        rand = random.random
+        rows = list(range(N))
+        greedy_cols = max(0, N - tail)
+        for i in range(N):
+            remaining = N - i
+            for _ in range(max_tries if i < greedy_cols else 1):
+                j = i + int(rand() * remaining)
+                r = rows[j]
+                if not (main_diag_counts[r - i + N] or anti_diag_counts[r + i]):
+                    break
+            rows[j] = rows[i]
+            rows[i] = r
+            main_diag_counts[r - i + N] += 1
+            anti_diag_counts[r + i] += 1
+        return rows
+
+    def min_conflicts_auto(
+        self,
+        max_steps: Optional[int] = None,
+        restart_limit: int = 50,
+        tail: int = 50,
+        seed: Optional[int] = None
+    ) -> Tuple[Optional[List[int]], dict]:
+
+        if seed is not None:
+            random.seed(seed)
+        N = self.board.N
+        if max_steps is None:
+            max_steps = 20 * N + 1000
+        rand = random.random
+        restarts = 0
+        steps = 0
+        conflicts = 0
+        start_time = time.time()
+
+        while restarts <= restart_limit:
+            #main diagonal shifted by +N, anti-diagonal r + c (same indexing as Board.count_conflicts)
+            main_diag_counts = [0] * (2 * N)
+            anti_diag_counts = [0] * (2 * N)
+            rows = self.greedy_placement(N, main_diag_counts, anti_diag_counts, tail=tail)
+
+            conflicts = 0
+            for counts in (main_diag_counts, anti_diag_counts):
+                for cnt in counts:
+                    if cnt > 1:
+                        conflicts += cnt * (cnt - 1) // 2
+
+            #index of conflicted queens: list for O(1) random pick, 'where' for O(1) removal.
+            #Entries are checked lazily on pick; a queen that joins a crowded diagonal is always added,
+            #so every diagonal with >= 2 queens keeps at least one indexed queen.
+            conflicted = [c for c in range(N)
+                          if main_diag_counts[rows[c] - c + N] > 1 or anti_diag_counts[rows[c] + c] > 1]
+            where = [-1] * N
+            for k, c in enumerate(conflicted):
+                where[c] = k
+
+            steps = 0
+            while conflicts > 0 and steps < max_steps:
+                steps += 1
+                k = int(rand() * len(conflicted))
+                i = conflicted[k]
+                ri = rows[i]
+                a = ri - i + N
+                b = ri + i
+                if main_diag_counts[a] < 2 and anti_diag_counts[b] < 2:
+                    #no longer conflicted: drop from the index
+                    last = conflicted.pop()
+                    if last != i:
+                        conflicted[k] = last
+                        where[last] = k
+                    where[i] = -1
+                    continue
+
+                #try swapping rows with a random column (keeps the permutation, so no row conflicts)
+                j = int(rand() * N)
+                if j == i:
+                    continue
+                rj = rows[j]
+                c = rj - j + N
+                d = rj + j
+                #leaving a line with k queens removes k-1 pairs
+                main_diag_counts[a] -= 1
+                loss = main_diag_counts[a]
+                anti_diag_counts[b] -= 1
+                loss += anti_diag_counts[b]
+                main_diag_counts[c] -= 1
+                loss += main_diag_counts[c]
+                anti_diag_counts[d] -= 1
+                loss += anti_diag_counts[d]
+                #joining a line with m queens adds m pairs
+                a2 = rj - i + N
+                b2 = rj + i
+                c2 = ri - j + N
+                d2 = ri + j
+                gain = main_diag_counts[a2]
+                main_diag_counts[a2] += 1
+                gain += anti_diag_counts[b2]
+                anti_diag_counts[b2] += 1
+                gain += main_diag_counts[c2]
+                main_diag_counts[c2] += 1
+                gain += anti_diag_counts[d2]
+                anti_diag_counts[d2] += 1
+
+                if gain < loss:
+                    rows[i] = rj
+                    rows[j] = ri
+                    conflicts += gain - loss
+                    for q, m, n in ((i, a2, b2), (j, c2, d2)):
+                        if where[q] < 0 and (main_diag_counts[m] > 1 or anti_diag_counts[n] > 1):
+                            where[q] = len(conflicted)
+                            conflicted.append(q)
+                else:
+                    #undo
+                    main_diag_counts[a2] -= 1
+                    anti_diag_counts[b2] -= 1
+                    main_diag_counts[c2] -= 1
+                    anti_diag_counts[d2] -= 1
+                    main_diag_counts[a] += 1
+                    anti_diag_counts[b] += 1
+                    main_diag_counts[c] += 1
+                    anti_diag_counts[d] += 1
+
+            if conflicts == 0:
+                return rows, {
+                    'success': True,
+                    'conflicts': 0,
+                    'steps': steps,
+                    'restarts': restarts,
+                    'runtime': time.time() - start_time
+                }
+            restarts += 1
+
+        return None, {
+            'success': False,
+            'conflicts': conflicts,
+            'steps': steps,
+            'restarts': restarts,
+            'runtime': time.time() - start_time
+        }
@@ -0,0 +1,40 @@
+def plot_scaling(results_df) -> None:
+    #scaling curves from test_config.run_config(); matplotlib is imported on use
+    import matplotlib.pyplot as plt
+
+    plt.figure()
+    plt.title('Median runtime (s) vs N (bars: median to p95)')
+    for solver, group in results_df.groupby('solver'):
+        group = group.sort_values('N')
+        plt.errorbar(group['N'], group['runtime_median'],
+                     yerr=[[0] * len(group), group['runtime_p95'] - group['runtime_median']],
+                     marker='o', capsize=3, label=solver)
+    plt.xscale('log', base=2)
+    plt.yscale('log')
+    plt.xlabel('N')
+    plt.ylabel('Runtime (s)')
+    plt.legend()
+    plt.show()
+
+    plt.figure()
+    plt.title('Peak memory (bytes) vs N')
+    for solver, group in results_df.groupby('solver'):
+        group = group.sort_values('N')
+        plt.plot(group['N'], group['peak_memory'], marker='o', label=solver)
+    plt.xscale('log', base=2)
+    plt.yscale('log')
+    plt.xlabel('N')
+    plt.ylabel('Peak memory (bytes)')
+    plt.legend()
+    plt.show()
+
+
+if __name__ == '__main__':
+    import sys
+
+    import pandas as pd
+
+    from .benchmark import Benchmark
+
+    #plot a saved benchmark history (default: the file test_config.py writes)
+    plot_scaling(pd.DataFrame(Benchmark.load(sys.argv[1] if len(sys.argv) > 1 else 'benchmark_history.json')))
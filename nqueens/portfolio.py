@@ -0,0 +1,103 @@
+import multiprocessing
+import os
+import queue
+import random
+import time
+from typing import List, Optional, Tuple
+
+from .board import Board
+from .csp import CSP
+from .local_search import LocalSearch
+
+
+#worker: runs one strategy and always reports back, so the parent never waits on a dead worker
+def _run_strategy(strategy: str, N: int, seed: int, options: dict, results) -> None:
+    try:
+        bo = Board(N, seed)
+        if strategy == 'csp':
+            sol, stats = CSP(bo, backend=options.get('backend', 'bitmask')).csp_auto(time_limit=options.get('time_limit'))
+        else:
+            sol, stats = LocalSearch(bo).local_search_auto(seed=seed, **options)
+    except Exception as e:
+        sol, stats = None, {'success': False, 'error': repr(e)}
+    results.put((strategy, seed, sol, stats))
+
+
+class Portfolio:
+    #Races independently seeded LocalSearch runs (and optionally one CSP run) in separate
+    #processes. The first valid board wins and the remaining workers are terminated.
+    def __init__(self, board: Board):
+        self.board = board
+
+    def portfolio_auto(
+        self,
+        workers: Optional[int] = None,
+        include_csp: bool = False,
+        csp_backend: str = 'bitmask',
+        time_limit: Optional[float] = None,
+        **ls_kwargs
+    ) -> Tuple[Optional[List[int]], dict]:
+        N = self.board.N
+        start_time = time.time()
+        if workers is None:
+            workers = os.cpu_count() or 1
+        base_seed = self.board.seed if self.board.seed is not None else random.randrange(2 ** 31)
+
+        #(strategy, seed, options) ; LocalSearch seeds are base_seed, base_seed + 1, ...
+        jobs = [('local_search', base_seed + i, dict(ls_kwargs)) for i in range(max(1, workers))]
+        if include_csp:
+            jobs.append(('csp', base_seed, {'backend': csp_backend, 'time_limit': time_limit}))
+
+        results = multiprocessing.Queue()
+        procs = [
+            multiprocessing.Process(target=_run_strategy, args=(strategy, N, seed, options, results), daemon=True)
+            for strategy, seed, options in jobs
+        ]
+        for p in procs:
+            p.start()
+
+        winner = None
+        finished = 0
+        timed_out = False
+        try:
+            while finished < len(procs):
+                remaining = None
+                if time_limit is not None:
+                    remaining = time_limit - (time.time() - start_time)
+                    if remaining <= 0:
+                        timed_out = True
+                        break
+                try:
+                    strategy, seed, sol, stats = results.get(timeout=remaining)
+                except queue.Empty:
+                    timed_out = True
+                    break
+                finished += 1
+                if sol is not None and stats.get('success') and Board.count_conflicts(sol) == 0:
+                    winner = (strategy, seed, sol, stats)
+                    break
+        finally:
+            #cancel the losers
+            for p in procs:
+                if p.is_alive():
+                    p.terminate()
+            for p in procs:
+                p.join()
+            results.close()
+
+        runtime = time.time() - start_time
+        if winner is None:
+            stats = {'success': False, 'runtime': runtime, 'workers': len(procs), 'finished': finished}
+            if timed_out:
+                stats['timeout'] = True
+            return None, stats
+
+        strategy, seed, sol, solver_stats = winner
+        return sol, {
+            'success': True,
+            'strategy': strategy,
+            'seed': seed,
+            'runtime': runtime,
+            'workers': len(procs),
+            'solver_stats': solver_stats
+        }
@@ -0,0 +1,69 @@
+from time import perf_counter
+from typing import Callable, Optional
+
+
+class Profiler:
+    #Opt-in instrumentation for CSP / LocalSearch: pass Profiler() as 'profiler=' to a solver.
+    #Solvers only touch it behind 'if profiler is not None', and phase timing works by wrapping
+    #the phase functions once per solve, so a solver without a profiler runs the original code.
+    #The report is added to the stats dict as stats['profile'] and passed to 'callback' when set.
+    #Solvers reset it when a solve starts, so each report covers one run only.
+    def __init__(self, callback: Optional[Callable[[dict], None]] = None):
+        self.callback = callback
+        self.timers = {}
+        self.calls = {}
+        self.counters = {}
+
+    def wrap(self, name: str, fn: Callable) -> Callable:
+        #cumulative wall time and call count of fn under 'name'
+        timers = self.timers
+        calls = self.calls
+        timers.setdefault(name, 0.0)
+        calls.setdefault(name, 0)
+
+        def timed(*args):
+            t0 = perf_counter()
+            try:
+                return fn(*args)
+            finally:
+                #get(): the profiler may have been reset since fn was wrapped
+                timers[name] = timers.get(name, 0.0) + perf_counter() - t0
+                calls[name] = calls.get(name, 0) + 1
+        return timed
+
+    def add_time(self, name: str, seconds: float, calls: int = 1) -> None:
+        #for phases timed inline in a hot loop (LocalSearch), where wrapping a function would add a call
+        self.timers[name] = self.timers.get(name, 0.0) + seconds
+        self.calls[name] = self.calls.get(name, 0) + calls
+
+    def count(self, name: str, amount: int = 1) -> None:
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    def peak(self, name: str, value: int) -> None:
+        if value > self.counters.get(name, 0):
+            self.counters[name] = value
+
+    def report(self) -> dict:
+        report = {
+            'timers': dict(self.timers),
+            'calls': dict(self.calls),
+            'counters': dict(self.counters)
+        }
+        proposals = self.counters.get('proposals')
+        if proposals:
+            accepted = self.counters.get('accepted', 0)
+            report['counters']['rejected'] = proposals - accepted
+            report['accept_ratio'] = accepted / proposals
+        return report
+
+    def finish(self, stats: dict) -> dict:
+        #attach the report to a solver's stats dict and notify the callback
+        stats['profile'] = self.report()
+        if self.callback is not None:
+            self.callback(stats['profile'])
+        return stats
+
+    def reset(self) -> None:
+        self.timers.clear()
+        self.calls.clear()
+        self.counters.clear()
@@ -0,0 +1,171 @@
+import math
+from typing import Iterable, Optional, Sequence
+
+import matplotlib.pyplot as plt
+import numpy as np
+
+SAFE_COLOR = (0.12, 0.47, 0.71, 1.0)
+CONFLICT_COLOR = (0.84, 0.15, 0.16, 1.0)
+
+
+def _figure_size(N: int) -> int:
+    if 4 <= N < 8:
+        return 5
+    if 8 <= N < 16:
+        return 8
+    if 16 <= N < 32:
+        return 12
+    return 14
+
+
+class BoardRenderer:
+    #Rasterized board view that is built once and then updated in place.
+    #The checkerboard is one NumPy image and all queens are one scatter layer (colour = in conflict
+    #or not). Above max_cells the board is downsampled to a queen-density heatmap with the
+    #conflicting queens' density as an overlay. Row / diagonal counters are kept between calls,
+    #so update(board, changed) only touches the changed columns before re-colouring in bulk.
+    #Unassigned columns (row -1, CSP partial assignments) are not drawn.
+    def __init__(self, N: int, max_cells: int = 256, figsize: Optional[float] = None):
+        self.N = N
+        self.scale = max(1, math.ceil(N / max_cells))
+        self.density = self.scale > 1
+        size = figsize or _figure_size(N)
+        self.fig, self.ax = plt.subplots(figsize=(size, size))
+        self.ax.set_axis_off()
+        self.rows = np.full(N, -1, dtype=np.int64)
+        self.cols = np.arange(N, dtype=np.int64)
+        self.row_counts = np.zeros(N, dtype=np.int64)
+        self.main_diag_counts = np.zeros(2 * N, dtype=np.int64)
+        self.anti_diag_counts = np.zeros(2 * N, dtype=np.int64)
+        self.conflicts = 0
+        self._handle = None
+
+        extent = (-0.5, N - 0.5, N - 0.5, -0.5)
+        if self.density:
+            bins = math.ceil(N / self.scale)
+            self.bins = bins
+            self.queen_density = np.zeros((bins, bins), dtype=np.int64)
+            self.image = self.ax.imshow(self.queen_density, cmap='Greys', extent=extent,
+                                        interpolation='nearest', vmin=0, vmax=1)
+            self.overlay = self.ax.imshow(np.ma.masked_all((bins, bins)), cmap='Reds', extent=extent,
+                                          interpolation='nearest', vmin=0, vmax=1, alpha=0.85)
+            self.queens = None
+        else:
+            checker = (self.cols[:, np.newaxis] + self.cols) % 2
+            self.image = self.ax.imshow(checker, cmap='gray', extent=extent, interpolation='nearest', vmin=0, vmax=1)
+            self.offsets = np.full((N, 2), np.nan)
+            self.offsets[:, 0] = self.cols
+            #marker side ~ 0.7 of a square, in points
+            side = 0.7 * size * 72 / N
+            marker = '$♛$' if N <= 64 else 's'
+            self.queens = self.ax.scatter(self.offsets[:, 0], self.offsets[:, 1], s=side * side,
+                                          marker=marker, linewidths=0)
+        self.title = self.ax.set_title('')
+
+    def _place(self, cols: np.ndarray, rows: np.ndarray, sign: int) -> None:
+        #add (sign=1) or remove (sign=-1) the queens at (cols, rows); negative rows are skipped
+        placed = rows >= 0
+        cols, rows = cols[placed], rows[placed]
+        N = self.N
+        np.add.at(self.row_counts, rows, sign)
+        np.add.at(self.main_diag_counts, rows - cols + N, sign)
+        np.add.at(self.anti_diag_counts, rows + cols, sign)
+        if self.density:
+            np.add.at(self.queen_density, (rows // self.scale, cols // self.scale), sign)
+
+    def _rebuild(self) -> None:
+        #full recount with bincount (np.add.at is only used for a few changed columns)
+        placed = self.rows >= 0
+        cols, rows = self.cols[placed], self.rows[placed]
+        N = self.N
+        self.row_counts = np.bincount(rows, minlength=N)
+        self.main_diag_counts = np.bincount(rows - cols + N, minlength=2 * N)
+        self.anti_diag_counts = np.bincount(rows + cols, minlength=2 * N)
+        if self.density:
+            self.queen_density = np.bincount((rows // self.scale) * self.bins + cols // self.scale,
+                                             minlength=self.bins * self.bins).reshape(self.bins, self.bins)
+
+    def conflict_mask(self) -> np.ndarray:
+        #True for every placed queen that shares a row or diagonal with another queen
+        rows, cols, N = self.rows, self.cols, self.N
+        placed = rows >= 0
+        safe_rows = np.where(placed, rows, 0)
+        attacked = ((self.row_counts[safe_rows] > 1)
+                    | (self.main_diag_counts[safe_rows - cols + N] > 1)
+                    | (self.anti_diag_counts[safe_rows + cols] > 1))
+        return attacked & placed
+
+    def _count_conflicts(self) -> int:
+        total = 0
+        for counts in (self.row_counts, self.main_diag_counts, self.anti_diag_counts):
+            total += int((counts * (counts - 1) // 2).sum())
+        return total
+
+    def update(self, board: Sequence[int], changed: Optional[Iterable[int]] = None, title: str = '') -> None:
+        #changed=None: the whole board is new; otherwise only those columns moved since the last call
+        if changed is None:
+            self.rows[:] = board
+            self._rebuild()
+            cols = self.cols
+        else:
+            cols = np.fromiter(changed, dtype=np.int64)
+            if cols.size:
+                self._place(cols, self.rows[cols], -1)
+                self.rows[cols] = [board[c] for c in cols]
+                self._place(cols, self.rows[cols], 1)
+
+        mask = self.conflict_mask()
+        self.conflicts = self._count_conflicts()
+        if self.density:
+            self.image.set_data(self.queen_density)
+            self.image.set_clim(0, max(1, int(self.queen_density.max())))
+            placed = self.rows >= 0
+            clashing = np.bincount((self.rows[mask] // self.scale) * self.bins + self.cols[mask] // self.scale,
+                                   minlength=self.bins * self.bins).reshape(self.bins, self.bins)
+            self.overlay.set_data(np.ma.masked_equal(clashing, 0))
+            self.overlay.set_clim(0, max(1, int(clashing.max())))
+            queens = int(placed.sum())
+        else:
+            if cols.size:
+                placed = self.rows[cols] >= 0
+                self.offsets[cols, 1] = np.where(placed, self.rows[cols], np.nan)
+                self.queens.set_offsets(self.offsets)
+            colors = np.empty((self.N, 4))
+            colors[:] = SAFE_COLOR
+            colors[mask] = CONFLICT_COLOR
+            self.queens.set_facecolors(colors)
+            queens = int((self.rows >= 0).sum())
+        caption = f"Conflicts: {self.conflicts}" + (f", queens: {queens}/{self.N}" if queens < self.N else "")
+        self.title.set_text(f"{title}\n{caption}" if title else caption)
+
+    def show(self) -> None:
+        #notebook: the first call displays the figure, later calls repaint the same output in place
+        try:
+            from IPython import get_ipython
+            from IPython.display import display
+        except ImportError:
+            get_ipython = None
+        if get_ipython is not None and get_ipython() is not None:
+            if self._handle is None:
+                #shown through the display handle only, not again by pyplot at the end of the cell
+                plt.close(self.fig)
+                self._handle = display(self.fig, display_id=True)
+            else:
+                self._handle.update(self.fig)
+            return
+        if self._handle is None:
+            self._handle = True
+            plt.show(block=False)
+        self.fig.canvas.draw_idle()
+        self.fig.canvas.flush_events()
+
+    def close(self) -> None:
+        plt.close(self.fig)
+
+
+def render_board(board: Sequence[int], title: str = '', max_cells: int = 256) -> BoardRenderer:
+    #one-shot drawing used by Board.display_board
+    renderer = BoardRenderer(len(board), max_cells=max_cells)
+    renderer.update(board, title=title)
+    plt.show()
+    return renderer
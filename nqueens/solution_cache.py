@@ -0,0 +1,124 @@
+import json
+import sqlite3
+import time
+from array import array
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+
+from .board import Board
+from .csp import CSP
+from .local_search import LocalSearch
+from .min_conflicts import MinConflicts
+
+
+class SolutionCache:
+    #Two-tier cache of solved boards keyed on (N, seed, solver, params):
+    #an in-memory LRU in front of an sqlite file, both size-bounded.
+    #Boards read back from disk are re-validated with Board.count_conflicts.
+    SOLVERS = ('csp', 'local_search', 'min_conflicts')
+
+    def __init__(self, path: Optional[str] = None, memory_size: int = 128, disk_size: int = 10000):
+        self.memory_size = memory_size
+        self.disk_size = disk_size
+        self.memory = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.db = None
+        if path is not None:
+            self.db = sqlite3.connect(path)
+            self.db.execute(
+                'CREATE TABLE IF NOT EXISTS solutions ('
+                'key TEXT PRIMARY KEY, n INTEGER, board BLOB, stats TEXT, last_used REAL)'
+            )
+            self.db.commit()
+
+    @staticmethod
+    def make_key(N: int, seed: Optional[int], solver: str, params: dict) -> str:
+        #stable text key; params are sorted so keyword order does not matter
+        return json.dumps([N, seed, solver, sorted(params.items())], default=repr)
+
+    def get(self, key: str) -> Optional[Tuple[List[int], dict]]:
+        if key in self.memory:
+            self.memory.move_to_end(key)
+            self.hits += 1
+            board, stats = self.memory[key]
+            return list(board), dict(stats)
+
+        if self.db is not None:
+            row = self.db.execute('SELECT n, board, stats FROM solutions WHERE key = ?', (key,)).fetchone()
+            if row is not None:
+                N, blob, stats_json = row
+                board = array('i')
+                board.frombytes(blob)
+                board = board.tolist()
+                #never trust the disk: drop anything that is not a full, conflict-free board
+                if len(board) != N or Board.count_conflicts(board) != 0:
+                    self.db.execute('DELETE FROM solutions WHERE key = ?', (key,))
+                    self.db.commit()
+                else:
+                    self.db.execute('UPDATE solutions SET last_used = ? WHERE key = ?', (time.time(), key))
+                    self.db.commit()
+                    stats = json.loads(stats_json)
+                    self._remember(key, board, stats)
+                    self.hits += 1
+                    return list(board), dict(stats)
+
+        self.misses += 1
+        return None
+
+    def put(self, key: str, board: List[int], stats: dict) -> None:
+        board = list(board)
+        self._remember(key, board, stats)
+        if self.db is not None:
+            self.db.execute(
+                'INSERT OR REPLACE INTO solutions (key, n, board, stats, last_used) VALUES (?, ?, ?, ?, ?)',
+                (key, len(board), array('i', board).tobytes(), json.dumps(stats), time.time())
+            )
+            #size-bounded: evict the least recently used rows
+            (count,) = self.db.execute('SELECT COUNT(*) FROM solutions').fetchone()
+            if count > self.disk_size:
+                self.db.execute(
+                    'DELETE FROM solutions WHERE key IN '
+                    '(SELECT key FROM solutions ORDER BY last_used ASC LIMIT ?)',
+                    (count - self.disk_size,)
+                )
+            self.db.commit()
+
+    def _remember(self, key: str, board: List[int], stats: dict) -> None:
+        self.memory[key] = (board, stats)
+        self.memory.move_to_end(key)
+        while len(self.memory) > self.memory_size:
+            self.memory.popitem(last=False)
+
+    def solve(self, solver: str, N: int, seed: Optional[int] = None, **params) -> Tuple[Optional[List[int]], dict]:
+        #cached front for CSP.csp_auto / LocalSearch.local_search_auto / MinConflicts.min_conflicts_auto
+        if solver not in self.SOLVERS:
+            raise ValueError(f"Unknown solver {solver!r}, expected one of {self.SOLVERS}")
+        key = self.make_key(N, seed, solver, params)
+        cached = self.get(key)
+        if cached is not None:
+            board, stats = cached
+            stats['cached'] = True
+            return board, stats
+
+        bo = Board(N, seed)
+        if solver == 'csp':
+            options = dict(params)
+            backend = options.pop('backend', 'sets')
+            heuristics = options.pop('heuristics', 'scan')
+            sol, stats = CSP(bo, backend=backend, heuristics=heuristics).csp_auto(**options)
+        elif solver == 'local_search':
+            sol, stats = LocalSearch(bo).local_search_auto(seed=seed, **params)
+        else:
+            sol, stats = MinConflicts(bo).min_conflicts_auto(seed=seed, **params)
+
+        #only solutions are cached; failures (e.g. timeouts) may succeed on a later run
+        if sol is not None and stats.get('success'):
+            self.put(key, sol, stats)
+            sol = list(sol)
+        return sol, dict(stats, cached=False)
+
+    def close(self) -> None:
+        if self.db is not None:
+            self.db.close()
+            self.db = None
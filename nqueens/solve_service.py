@@ -0,0 +1,255 @@
+import asyncio
+import json
+import multiprocessing
+import time
+from typing import List, Optional, Tuple
+
+from .board import Board
+from .constructive import Constructive
+from .csp import CSP
+from .local_search import LocalSearch
+from .min_conflicts import MinConflicts
+from .step_events import StepEvent
+
+
+def _make_solver(solver: str, N: int, seed: Optional[int], params: dict):
+    #(solver object, keyword arguments for its run method) ; CSP takes backend / heuristics in its constructor
+    bo = Board(N, seed)
+    options = dict(params)
+    if solver == 'csp':
+        backend = options.pop('backend', 'sets')
+        heuristics = options.pop('heuristics', 'scan')
+        return CSP(bo, backend=backend, heuristics=heuristics), options
+    if solver == 'local_search':
+        return LocalSearch(bo), dict(options, seed=seed)
+    if solver == 'min_conflicts':
+        return MinConflicts(bo), dict(options, seed=seed)
+    return Constructive(bo), options
+
+
+#one solve in a worker, result sent back over the pipe
+def _solve_worker(solver: str, N: int, seed: Optional[int], params: dict, conn) -> None:
+    try:
+        obj, options = _make_solver(solver, N, seed, params)
+        if solver == 'csp':
+            sol, stats = obj.csp_auto(**options)
+        elif solver == 'local_search':
+            sol, stats = obj.local_search_auto(**options)
+        elif solver == 'min_conflicts':
+            sol, stats = obj.min_conflicts_auto(**options)
+        else:
+            sol, stats = obj.constructive_auto()
+        conn.send((list(sol) if sol is not None else None, stats))
+    except Exception as e:
+        conn.send((None, {'success': False, 'error': repr(e)}))
+
+
+#step events of one solve as plain tuples (StepEvent objects are reused, so they are copied out)
+def _stream_worker(solver: str, N: int, seed: Optional[int], every: int, params: dict, conn) -> None:
+    try:
+        obj, options = _make_solver(solver, N, seed, params)
+        if solver == 'csp':
+            events = obj.csp_events(every=every, **options)
+        else:
+            events = obj.local_search_events(every=every, **options)
+        for e in events:
+            conn.send((e.kind, e.step, e.col, e.old_row, e.new_row, e.conflicts, e.assigned, e.restarts,
+                       e.temperature, e.runtime, dict(e.changes), list(e.board) if e.board is not None else None))
+        conn.send(None)
+    except Exception as e:
+        conn.send(('error', repr(e)))
+
+
+#worker process: runs jobs sent by SolveService until the pipe closes
+def _worker_loop(conn) -> None:
+    while True:
+        try:
+            kind, args = conn.recv()
+        except EOFError:
+            return
+        if kind == 'solve':
+            _solve_worker(*args, conn)
+        else:
+            _stream_worker(*args, conn)
+
+
+class SolveService:
+    #asyncio front end for the solvers. Jobs run on a pool of at most max_workers worker
+    #processes that are reused between jobs; cancelling a job or hitting its deadline kills its
+    #worker, which is replaced on demand. Identical concurrent requests (solver, N, seed, params)
+    #share one job, but each waiter keeps its own deadline; the job is cancelled once every
+    #waiter has timed out or been cancelled.
+    SOLVERS = ('csp', 'local_search', 'min_conflicts', 'constructive')
+    STREAM_SOLVERS = ('csp', 'local_search')
+
+    def __init__(self, max_workers: Optional[int] = None):
+        self.max_workers = max_workers or multiprocessing.cpu_count()
+        self._slots = None
+        self._jobs = {}
+        #(process, pipe) of workers waiting for a job
+        self._idle = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    def _slot_semaphore(self) -> asyncio.Semaphore:
+        #created lazily so the service can be constructed outside a running loop
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_workers)
+        return self._slots
+
+    @staticmethod
+    async def _recv(conn):
+        #wait for the pipe without blocking the event loop
+        loop = asyncio.get_running_loop()
+        ready = loop.create_future()
+
+        def on_readable():
+            if not ready.done():
+                ready.set_result(None)
+
+        loop.add_reader(conn.fileno(), on_readable)
+        try:
+            await ready
+        finally:
+            loop.remove_reader(conn.fileno())
+        return conn.recv()
+
+    @staticmethod
+    def _start():
+        conn, child_conn = multiprocessing.Pipe()
+        proc = multiprocessing.Process(target=_worker_loop, args=(child_conn,), daemon=True)
+        proc.start()
+        child_conn.close()
+        return proc, conn
+
+    def _acquire(self):
+        #an idle worker if one is alive, else a new one (callers hold a slot, so at most max_workers)
+        while self._idle:
+            proc, conn = self._idle.pop()
+            if proc.is_alive():
+                return proc, conn
+            self._stop(proc, conn)
+        return self._start()
+
+    def _release(self, proc, conn, reuse: bool) -> None:
+        #only a worker that finished its job cleanly has nothing left in its pipe
+        if reuse and proc.is_alive():
+            self._idle.append((proc, conn))
+        else:
+            self._stop(proc, conn)
+
+    @staticmethod
+    def _stop(proc, conn) -> None:
+        if proc.is_alive():
+            proc.kill()
+        proc.join()
+        conn.close()
+
+    async def _run(self, solver: str, N: int, seed: Optional[int], params: dict) -> Tuple[Optional[List[int]], dict]:
+        #no deadline of its own: the waiters in solve() time out and cancel it when none is left
+        start_time = time.time()
+        async with self._slot_semaphore():
+            proc, conn = self._acquire()
+            finished = False
+            try:
+                conn.send(('solve', (solver, N, seed, params)))
+                result = await self._recv(conn)
+                finished = True
+                return result
+            except (EOFError, BrokenPipeError):
+                proc.join(1.0)
+                return None, {'success': False, 'error': f'worker exited with code {proc.exitcode}',
+                              'runtime': time.time() - start_time}
+            finally:
+                self._release(proc, conn, finished)
+
+    async def solve(self, solver: str, N: int, seed: Optional[int] = None, deadline: Optional[float] = None,
+                    **params) -> Tuple[Optional[List[int]], dict]:
+        #deadline: seconds from submission, including time spent waiting for a free worker
+        start_time = time.time()
+        if solver not in self.SOLVERS:
+            raise ValueError(f"Unknown solver {solver!r}, expected one of {self.SOLVERS}")
+        key = json.dumps([N, seed, solver, sorted(params.items())], default=repr)
+        job = self._jobs.get(key)
+        if job is not None and job['task'].cancelled():
+            #cancelled but its done-callback has not run yet: never join a dying job
+            job = None
+        coalesced = job is not None
+        if job is None:
+            job = {'task': asyncio.ensure_future(self._run(solver, N, seed, params)), 'waiters': 0}
+            self._jobs[key] = job
+            job['task'].add_done_callback(lambda _, key=key, job=job: self._jobs.pop(key, None) if self._jobs.get(key) is job else None)
+        job['waiters'] += 1
+        remaining = None if deadline is None else deadline - (time.time() - start_time)
+        try:
+            #shield: one waiter's cancellation or timeout must not cancel the shared job
+            sol, stats = await asyncio.wait_for(asyncio.shield(job['task']), remaining)
+        except asyncio.TimeoutError:
+            return None, {'success': False, 'timeout': True, 'runtime': time.time() - start_time,
+                          'coalesced': coalesced}
+        finally:
+            job['waiters'] -= 1
+            if job['waiters'] == 0 and not job['task'].done():
+                #unregister first, so an identical request from now on starts a new job
+                if self._jobs.get(key) is job:
+                    del self._jobs[key]
+                job['task'].cancel()
+        #copies: coalesced waiters must not share mutable results
+        return (list(sol) if sol is not None else None), dict(stats, coalesced=coalesced)
+
+    async def stream(self, solver: str, N: int, seed: Optional[int] = None, every: int = 1,
+                     deadline: Optional[float] = None, **params):
+        #async iterator of StepEvent copies from csp_events / local_search_events
+        if solver not in self.STREAM_SOLVERS:
+            raise ValueError(f"Step events are only available for {self.STREAM_SOLVERS}")
+        start_time = time.time()
+        async with self._slot_semaphore():
+            proc, conn = self._acquire()
+            finished = False
+            try:
+                conn.send(('stream', (solver, N, seed, max(1, every), params)))
+                while True:
+                    remaining = None if deadline is None else deadline - (time.time() - start_time)
+                    try:
+                        if remaining is not None and remaining <= 0:
+                            raise asyncio.TimeoutError
+                        msg = await asyncio.wait_for(self._recv(conn), remaining)
+                    except asyncio.TimeoutError:
+                        event = StepEvent()
+                        event.kind = 'timeout'
+                        event.runtime = time.time() - start_time
+                        yield event
+                        return
+                    except EOFError:
+                        return
+                    if msg is None:
+                        finished = True
+                        return
+                    if msg[0] == 'error':
+                        finished = True
+                        raise RuntimeError(msg[1])
+                    event = StepEvent()
+                    (event.kind, event.step, event.col, event.old_row, event.new_row, event.conflicts, event.assigned,
+                     event.restarts, event.temperature, event.runtime, event.changes, event.board) = msg
+                    yield event
+            finally:
+                #a consumer that stopped early leaves events in the pipe: that worker is killed
+                self._release(proc, conn, finished)
+
+    async def close(self) -> None:
+        #cancel every in-flight job (their worker processes are killed) and stop the idle workers
+        tasks = [job['task'] for job in self._jobs.values()]
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
+            try:
+                await task
+            except (asyncio.CancelledError, Exception):
+                pass
+        self._jobs.clear()
+        while self._idle:
+            self._stop(*self._idle.pop())
@@ -0,0 +1,53 @@
+from typing import List, Tuple
+
+
+class StepEvent:
+    #Compact step-mode record. A producer reuses ONE StepEvent for the whole run, so an event is
+    #only valid until the next one is requested; use BoardReplayer (or copy) to keep state.
+    #  kind      : 'step' / 'solved' / 'failed' (local search), 'assign' / 'backtrack' / 'solved' /
+    #              'failed' / 'timeout' (CSP)
+    #  col, old_row, new_row : last move since the previous event (-1 = none / unassigned)
+    #  changes   : {col: row} for every column changed since the previous event (row -1 = unassigned)
+    #  board     : full board, only set when the state is replaced (start of a local search run)
+    __slots__ = ('kind', 'step', 'col', 'old_row', 'new_row', 'conflicts', 'assigned',
+                 'restarts', 'temperature', 'runtime', 'changes', 'board')
+
+    def __init__(self):
+        self.kind = ''
+        self.step = 0
+        self.col = -1
+        self.old_row = -1
+        self.new_row = -1
+        self.conflicts = 0
+        self.assigned = 0
+        self.restarts = 0
+        self.temperature = 0.0
+        self.runtime = 0.0
+        self.changes = {}
+        self.board = None
+
+    def clear(self):
+        #called by the producer after the consumer has seen the event
+        self.col = self.old_row = self.new_row = -1
+        self.changes.clear()
+        self.board = None
+
+    def delta(self) -> Tuple[int, int, int, int]:
+        return self.col, self.old_row, self.new_row, self.conflicts
+
+
+class BoardReplayer:
+    #Rebuilds full boards from a StepEvent stream (e.g. for interface.py's on_next).
+    def __init__(self, N: int):
+        self.board = [-1] * N
+
+    #O(changes) per event, O(N) only when the event carries a full board
+    def apply(self, event: StepEvent) -> List[int]:
+        if event.board is not None:
+            self.board[:] = event.board
+        for c, r in event.changes.items():
+            self.board[c] = r
+        return self.board
+
+    def snapshot(self) -> List[int]:
+        return list(self.board)
@@ -0,0 +1,25 @@
+from typing import List, Optional
+
+from .benchmark import Benchmark
+
+#Scaling sweep: N = 8, 16, 32, ... per solver, repeated over the seeds below
+SOLVERS = ['local_search', 'csp', 'csp_bitmask', 'min_conflicts', 'constructive']
+SEEDS = [1, 5, 12, 14]
+
+
+def run_config(history_path: Optional[str] = 'benchmark_history.json', solvers: Optional[List[str]] = None,
+               seeds: Optional[List[int]] = None, verbose: bool = True):
+    #returns results_df (pandas is imported here, not at package import)
+    import pandas as pd
+
+    bench = Benchmark(solvers=solvers or SOLVERS, seeds=seeds or SEEDS)
+    bench.run(verbose=verbose)
+    #history of every run; pass the previous file to bench.compare(...) to flag regressions
+    if history_path:
+        bench.save(history_path)
+    return pd.DataFrame(bench.results)
+
+
+if __name__ == '__main__':
+    results_df = run_config()
+    print(results_df)
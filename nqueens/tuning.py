@@ -0,0 +1,188 @@
+import json
+import os
+import time
+from time import perf_counter
+from typing import Dict, List, Optional, Tuple, Union
+
+from .board import Board
+
+#Annealing schedule used by LocalSearch: temperature starts at initial_temp and is multiplied by
+#1 - cooling / N per step; a run restarts after stagnation_limit cold steps without improvement.
+SCHEDULE_KEYS = ('initial_temp', 'cooling', 'stagnation_limit', 'restart_limit')
+
+#the hand-written tiers LocalSearch used before tuning; used for any N a profile does not cover
+DEFAULT_BUCKETS = [
+    {'min_n': 0, 'max_n': 4, 'initial_temp': 1000.0, 'cooling': 1.0, 'stagnation_limit': 5000, 'restart_limit': 25},
+    {'min_n': 4, 'max_n': 8, 'initial_temp': 1000.0, 'cooling': 1.0, 'stagnation_limit': 500, 'restart_limit': 25},
+    {'min_n': 8, 'max_n': 16, 'initial_temp': 1000.0, 'cooling': 1.0, 'stagnation_limit': 1000, 'restart_limit': 25},
+    {'min_n': 16, 'max_n': 32, 'initial_temp': 1000.0, 'cooling': 1.0, 'stagnation_limit': 2250, 'restart_limit': 25},
+    {'min_n': 32, 'max_n': None, 'initial_temp': 1000.0, 'cooling': 1.0, 'stagnation_limit': 5000, 'restart_limit': 25},
+]
+
+DEFAULT_GRID = {
+    'initial_temp': [10.0, 100.0, 1000.0],
+    'cooling': [0.5, 1.0, 2.0],
+    'stagnation_limit': [250, 500, 1000, 2250, 5000],
+    'restart_limit': [10, 25, 50],
+}
+
+#LocalSearch loads this file when no profile is given (NQUEENS_TUNING_PROFILE overrides the path)
+PROFILE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'tuning_profile.json')
+
+#no tuned buckets: the default tiers only (trials must not pick up a previously saved profile)
+DEFAULT_PROFILE = {'version': 1, 'buckets': []}
+
+_loaded = {}
+
+
+def load_profile(profile: Union[None, str, dict] = None) -> dict:
+    #profile: a path, an already loaded profile dict, or None for the default file.
+    #A missing default file means the untuned DEFAULT_BUCKETS. Files are cached by path and mtime,
+    #so constructing many LocalSearch objects reads the profile once.
+    if isinstance(profile, dict):
+        return profile
+    path = profile or os.environ.get('NQUEENS_TUNING_PROFILE') or PROFILE_PATH
+    try:
+        mtime = os.path.getmtime(path)
+    except OSError:
+        if profile is not None:
+            raise FileNotFoundError(f"Tuning profile not found: {path}")
+        return DEFAULT_PROFILE
+    cached = _loaded.get(path)
+    if cached is None or cached[0] != mtime:
+        with open(path) as f:
+            cached = (mtime, json.load(f))
+        _loaded[path] = cached
+    return cached[1]
+
+
+def schedule_for(N: int, profile: Union[None, str, dict] = None) -> dict:
+    #annealing parameters for board size N: first profile bucket containing N, else the default tiers
+    for bucket in load_profile(profile).get('buckets', []) + DEFAULT_BUCKETS:
+        if bucket['min_n'] <= N and (bucket['max_n'] is None or N < bucket['max_n']):
+            return {key: bucket[key] for key in SCHEDULE_KEYS}
+    raise ValueError(f"No schedule for N={N}")
+
+
+#worker: one LocalSearch run with a fixed schedule
+def _run_trial(task: Tuple[int, int, int, dict, int]) -> Tuple[int, int, int, bool, float, int]:
+    from .local_search import LocalSearch
+
+    N, index, seed, params, max_steps = task
+    bo = Board(N, seed)
+    t0 = perf_counter()
+    sol, stats = LocalSearch(bo, profile=DEFAULT_PROFILE).local_search_auto(seed=seed, max_steps=max_steps, **params)
+    runtime = perf_counter() - t0
+    return N, index, seed, bool(sol is not None and stats.get('success')), runtime, stats.get('steps', 0)
+
+
+class Tuner:
+    #Grid search over annealing schedules. Every (N, schedule, seed) trial runs in a worker process;
+    #a schedule's score at one N is its mean time-to-solution over the seeds, with failed runs
+    #charged failure_penalty times their runtime. Sizes are grouped into power-of-two buckets
+    #([8, 16), [16, 32), ...) and each bucket keeps the schedule with the best mean score relative
+    #to the best schedule at each of its sizes. The largest bucket is left open-ended.
+    def __init__(self, sizes: Optional[List[int]] = None, seeds: Optional[List[int]] = None,
+                 grid: Optional[Dict[str, list]] = None, processes: Optional[int] = None,
+                 max_steps: int = 100000, failure_penalty: float = 10.0):
+        self.sizes = sizes if sizes is not None else [8, 12, 16, 24, 32, 48, 64]
+        self.seeds = seeds if seeds is not None else list(range(1, 9))
+        self.grid = dict(DEFAULT_GRID)
+        if grid:
+            self.grid.update(grid)
+        for key in self.grid:
+            if key not in SCHEDULE_KEYS:
+                raise ValueError(f"Unknown schedule parameter {key!r}, expected one of {SCHEDULE_KEYS}")
+        self.processes = processes
+        self.max_steps = max_steps
+        self.failure_penalty = failure_penalty
+        self.trials = []
+        self.profile = None
+
+    def candidates(self, N: int) -> List[dict]:
+        #full grid, plus the current default for N so every bucket can report its speedup over it
+        combos = [{}]
+        for key in SCHEDULE_KEYS:
+            combos = [dict(c, **{key: value}) for c in combos for value in self.grid[key]]
+        default = schedule_for(N, DEFAULT_PROFILE)
+        if default not in combos:
+            combos.append(default)
+        return combos
+
+    @staticmethod
+    def bucket_of(N: int) -> Tuple[int, int]:
+        low = 1 << (N.bit_length() - 1)
+        return low, low * 2
+
+    def run(self, verbose: bool = False) -> dict:
+        candidates = {N: self.candidates(N) for N in self.sizes}
+        tasks = [(N, i, seed, params, self.max_steps)
+                 for N in self.sizes for i, params in enumerate(candidates[N]) for seed in self.seeds]
+        #imported here: LocalSearch imports this module, and multiprocessing is slow to import
+        from multiprocessing import Pool
+
+        start_time = time.time()
+        self.trials = []
+        with Pool(self.processes) as pool:
+            for trial in pool.imap_unordered(_run_trial, tasks, chunksize=4):
+                self.trials.append(trial)
+        if verbose:
+            print(f"{len(tasks)} trials in {time.time() - start_time:.1f}s")
+        self.profile = self.fit(candidates)
+        if verbose:
+            for bucket in self.profile['buckets']:
+                print(f"N in [{bucket['min_n']}, {bucket['max_n']}): "
+                      + ", ".join(f"{key}={bucket[key]}" for key in SCHEDULE_KEYS)
+                      + f"  speedup={bucket['speedup']:.2f}x")
+        return self.profile
+
+    def fit(self, candidates: Dict[int, List[dict]]) -> dict:
+        #score[N][i]: mean penalised time-to-solution of candidate i at size N
+        totals = {}
+        for N, index, seed, success, runtime, steps in self.trials:
+            cost = runtime if success else runtime * self.failure_penalty
+            totals.setdefault(N, {}).setdefault(index, []).append(cost)
+        scores = {N: {i: sum(costs) / len(costs) for i, costs in per_n.items()} for N, per_n in totals.items()}
+
+        buckets = {}
+        for N in sorted(scores):
+            buckets.setdefault(self.bucket_of(N), []).append(N)
+        fitted = []
+        for (low, high), sizes in sorted(buckets.items()):
+            relative = {}
+            for N in sizes:
+                best = max(1e-12, min(scores[N].values()))
+                for i, score in scores[N].items():
+                    key = json.dumps(candidates[N][i], sort_keys=True)
+                    relative.setdefault(key, []).append(score / best)
+            key = min(relative, key=lambda k: sum(relative[k]) / len(relative[k]))
+            params = json.loads(key)
+            default = json.dumps(schedule_for(low, DEFAULT_PROFILE), sort_keys=True)
+            default_score = sum(relative[default]) / len(relative[default])
+            best_score = sum(relative[key]) / len(relative[key])
+            fitted.append(dict({'min_n': low, 'max_n': high}, **params,
+                               sizes=sizes, speedup=default_score / best_score))
+        if fitted:
+            fitted[-1]['max_n'] = None
+        return {
+            'version': 1,
+            'created': time.time(),
+            'seeds': self.seeds,
+            'max_steps': self.max_steps,
+            'failure_penalty': self.failure_penalty,
+            'buckets': fitted
+        }
+
+    def save(self, path: Optional[str] = None) -> str:
+        if self.profile is None:
+            raise RuntimeError("Nothing to save, call run() first")
+        path = path or PROFILE_PATH
+        with open(path, 'w') as f:
+            json.dump(self.profile, f, indent=1)
+        return path
+
+
+if __name__ == '__main__':
+    tuner = Tuner()
+    tuner.run(verbose=True)
+    print(f"Saved {tuner.save()}")
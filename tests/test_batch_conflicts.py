@@ -0,0 +1,29 @@
+import random
+
+import pytest
+
+from nqueens import Board, Constructive
+
+np = pytest.importorskip('numpy')
+from nqueens.batch_conflicts import count_conflicts_batch, validate_batch  # noqa: E402
+
+
+def test_batch_matches_scalar():
+    rng = random.Random(0)
+    for N in (1, 4, 9, 32):
+        boards = [[rng.randrange(N) for _ in range(N)] for _ in range(50)]
+        boards.append(Constructive.construct(N))
+        counts = count_conflicts_batch(np.array(boards))
+        assert counts.tolist() == [Board.count_conflicts(b) for b in boards]
+        assert validate_batch(boards).tolist() == [c == 0 for c in counts.tolist()]
+
+
+def test_single_board_and_empty_batch():
+    board = [0, 2, 4, 1, 3]
+    assert count_conflicts_batch(board).tolist() == [Board.count_conflicts(board)]
+    assert count_conflicts_batch(np.zeros((0, 6), dtype=np.int32)).tolist() == []
+
+
+def test_rows_out_of_range():
+    with pytest.raises(ValueError):
+        count_conflicts_batch([[0, 4, 1, 2]])
@@ -0,0 +1,42 @@
+import random
+from array import array
+
+from nqueens import Board
+from nqueens.board import CompactBoard, ConflictCounter
+
+
+def attacked(board, col):
+    return any(board[c] == board[col] or abs(board[c] - board[col]) == abs(c - col)
+               for c in range(len(board)) if c != col)
+
+
+def test_conflict_counter_matches_recount():
+    rng = random.Random(0)
+    for N in (1, 2, 5, 8, 23):
+        board = [rng.randrange(N) for _ in range(N)]
+        counter = ConflictCounter(board)
+        assert counter.conflicts == Board.count_conflicts(board)
+        for _ in range(300):
+            col, row = rng.randrange(N), rng.randrange(N)
+            expected = Board.count_conflicts(board[:col] + [row] + board[col + 1:])
+            assert counter.conflicts + counter.delta(col, row) == expected
+            assert counter.move(col, row) == expected
+            assert counter.board is board and board[col] == row
+            assert Board.count_conflicts(board) == expected
+            for c in range(N):
+                assert counter.attacked(c) == attacked(board, c)
+
+
+def test_count_conflicts_pairs():
+    #k queens on one line add k(k-1)/2
+    assert Board.count_conflicts([0, 0, 0, 0]) == 6
+    assert Board.count_conflicts([0, 1, 2, 3]) == 6
+    assert Board.count_conflicts([1, 3, 0, 2]) == 0
+
+
+def test_compact_board_chunked_fill():
+    #filled in chunks, but the same rows as one choices(k=N) call
+    N = CompactBoard.CHUNK + 1000
+    board = CompactBoard(N, seed=4).board
+    assert isinstance(board, array) and board.itemsize == 4
+    assert board == array('i', random.Random(4).choices(range(N), k=N))
@@ -0,0 +1,50 @@
+import random
+
+import pytest
+
+from nqueens import Board, Constructive
+from nqueens.board_file import BoardFile
+
+np = pytest.importorskip('numpy')
+
+
+def test_round_trip(tmp_path):
+    path = str(tmp_path / 'boards.nqb')
+    boards = [Constructive.construct(N) for N in (1, 5, 8, 31)]
+    f = BoardFile(path)
+    for i, board in enumerate(boards):
+        assert f.append(board, 'constructive', seed=i) == i
+    f = BoardFile(path)
+    assert len(f) == len(boards)
+    for i, (header, rows) in enumerate(f):
+        assert header['seed'] == i and header['solver'] == 'constructive' and header['conflicts'] == 0
+        assert list(rows) == boards[i]
+
+
+def test_verify_matches_count_conflicts(tmp_path):
+    #small chunks and windows force several passes over the payload
+    path = str(tmp_path / 'boards.nqb')
+    rng = random.Random(0)
+    f = BoardFile(path)
+    boards = [Constructive.construct(101)] + [[rng.randrange(N) for _ in range(N)] for N in (1, 7, 64, 101)]
+    for board in boards:
+        f.append(board)
+    for i, board in enumerate(boards):
+        expected = Board.count_conflicts(board)
+        for chunk_size, memory_limit in ((1 << 20, 256 << 20), (7, 40)):
+            result = f.verify(i, chunk_size=chunk_size, memory_limit=memory_limit)
+            assert result['conflicts'] == expected
+            assert result['checksum_ok'] and result['in_range'] and result['header_conflicts_ok']
+            assert result['valid'] == (expected == 0)
+
+
+def test_verify_detects_corruption(tmp_path):
+    path = str(tmp_path / 'boards.nqb')
+    f = BoardFile(path)
+    f.append(Constructive.construct(16))
+    _, payload = f.records[0]
+    with open(path, 'r+b') as out:
+        out.seek(payload)
+        out.write((99).to_bytes(4, 'little'))
+    result = BoardFile(path).verify(0)
+    assert not result['valid'] and not result['in_range'] and result['conflicts'] is None
@@ -0,0 +1,76 @@
+import json
+import random
+
+import pytest
+
+from nqueens import Board, CSP, LocalSearch
+from nqueens.board import CompactBoard
+from nqueens.checkpoint import rng_state, set_rng_state
+
+
+def boards(N):
+    yield lambda: Board(N)
+    yield lambda: CompactBoard(N, seed=3)
+    try:
+        import numpy as np
+    except ImportError:
+        return
+    yield lambda: CompactBoard(N, rng=np.random.default_rng(3))
+
+
+def outcome(result):
+    board, stats = result
+    return (None if board is None else [int(r) for r in board],
+            {k: v for k, v in stats.items() if k not in ('runtime', 'checkpoint')})
+
+
+@pytest.mark.parametrize('max_steps', [40, 150])
+def test_local_search_resume_is_deterministic(tmp_path, max_steps):
+    #stop after 2 restarts and resume with a larger budget: same result as one uninterrupted run
+    path = str(tmp_path / 'run.ckpt')
+    for make in boards(8):
+        for seed in range(4):
+            expected = outcome(LocalSearch(make()).local_search_auto(max_steps=max_steps, restart_limit=8, seed=seed))
+            result = LocalSearch(make()).local_search_auto(max_steps=max_steps, restart_limit=2, seed=seed,
+                                                           checkpoint=path)
+            if not result[1]['success']:
+                random.seed(999)
+                result = LocalSearch(make()).resume(path, restart_limit=8)
+            assert outcome(result) == expected
+
+
+def test_rng_state_round_trip():
+    rngs = [random.Random(1)]
+    try:
+        import numpy as np
+        rngs += [np.random.default_rng(1), np.random.Generator(np.random.MT19937(1))]
+    except ImportError:
+        pass
+    for rng in rngs:
+        state = json.loads(json.dumps(rng_state(rng)))
+        expected = [rng.random() for _ in range(5)]
+        set_rng_state(state, rng)
+        assert [rng.random() for _ in range(5)] == expected
+
+
+def test_csp_resume_is_deterministic(tmp_path):
+    path = str(tmp_path / 'run.ckpt')
+    N = 100
+    expected = outcome(CSP(Board(N), 'bitmask').csp_auto(time_limit=60))
+    result = CSP(Board(N), 'bitmask').csp_auto(time_limit=0.02, checkpoint=path, checkpoint_every=0.005)
+    resumes = 0
+    while result[0] is None and result[1].get('timeout'):
+        result = CSP(Board(N), 'bitmask').resume(path, time_limit=0.02, checkpoint_every=0.005)
+        resumes += 1
+    assert resumes > 0
+    assert outcome(result) == expected
+
+
+def test_csp_checkpoint_removed_when_exhausted(tmp_path):
+    #no solution: the finished search must not leave a checkpoint for resume() to replay
+    path = tmp_path / 'run.ckpt'
+    for backend in ('sets', 'bitmask'):
+        out, stats = CSP(Board(3), backend).csp_auto(checkpoint=str(path), checkpoint_every=0.0)
+        assert out is None and not stats['success'] and not path.exists()
+        out, stats = CSP(Board(6), backend).csp_repair([0] * 6, {0: 0}, checkpoint=str(path), checkpoint_every=0.0)
+        assert out is None and not stats['success'] and not path.exists()
@@ -0,0 +1,25 @@
+from array import array
+
+from nqueens import Board, Constructive
+
+
+def test_construct_is_valid():
+    #every residue of N mod 6, including the two fix-up cases
+    for N in list(range(4, 300)) + [1000, 1001, 1002, 1003, 1004, 1005]:
+        board = Constructive.construct(N)
+        assert sorted(board) == list(range(N))
+        assert Board.count_conflicts(board) == 0
+
+
+def test_no_solution():
+    assert Constructive.construct(1) == [0]
+    assert Constructive.construct(2) is None
+    assert Constructive.construct(3) is None
+    board, stats = Constructive(Board(3)).constructive_auto()
+    assert board is None and not stats['success']
+
+
+def test_fill_in_place():
+    board = array('i', [0] * 50)
+    assert Constructive.fill(board)
+    assert list(board) == Constructive.construct(50)
@@ -0,0 +1,44 @@
+import random
+
+from nqueens import Board, CSP, Constructive
+
+BACKENDS = [('sets', 'scan'), ('bitmask', 'scan'), ('bitmask', 'incremental')]
+
+
+def perturbed(N, moved, seed):
+    rng = random.Random(seed)
+    solution = Constructive.construct(N)
+    board = list(solution)
+    for col in rng.sample(range(N), moved):
+        board[col] = rng.randrange(N)
+    return solution, board
+
+
+def test_repair_is_local():
+    #5 moved queens at N=200: only the attacked columns and a few of their blockers change
+    N = 200
+    for backend, heuristics in BACKENDS:
+        for seed in range(3):
+            solution, board = perturbed(N, 5, seed)
+            pin = next(c for c in range(N) if board[c] != solution[c])
+            out, stats = CSP(Board(N), backend, heuristics=heuristics).csp_repair(board, {pin: board[pin]}, time_limit=30)
+            assert stats['success']
+            assert Board.count_conflicts(out) == 0
+            assert out[pin] == board[pin]
+            assert stats['changed'] == sum(1 for c in range(N) if out[c] != board[c])
+            assert stats['changed'] <= 40
+            assert stats['freed'] < N // 2
+
+
+def test_repair_keeps_valid_board():
+    solution = Constructive.construct(30)
+    for backend, heuristics in BACKENDS:
+        out, stats = CSP(Board(30), backend, heuristics=heuristics).csp_repair(solution)
+        assert out == solution
+        assert stats['changed'] == 0
+
+
+def test_repair_unsatisfiable_pins():
+    for backend, heuristics in BACKENDS:
+        out, stats = CSP(Board(3), backend, heuristics=heuristics).csp_repair([0, 1, 2])
+        assert out is None and not stats['success']
@@ -0,0 +1,26 @@
+import pytest
+
+from nqueens import Board
+from nqueens.min_conflicts import MinConflicts
+
+
+#N = 8, 14, 1004 are 2 (mod 6) and 9, 15, 1005 are 3 (mod 6), the cases the constructive
+#pattern needs fix-ups for
+@pytest.mark.parametrize('N', [1, 4, 5, 8, 9, 14, 15, 50, 1004, 1005, 20000])
+def test_solves(N):
+    board, stats = MinConflicts(Board(N)).min_conflicts_auto(seed=1)
+    assert stats['success'] and stats['conflicts'] == 0
+    assert len(board) == N and Board.count_conflicts(board) == 0
+
+
+@pytest.mark.parametrize('N', [2, 3])
+def test_no_solution(N):
+    board, stats = MinConflicts(Board(N)).min_conflicts_auto(seed=1)
+    assert board is None and stats['success'] is False
+
+
+def test_seed_is_reproducible():
+    first = MinConflicts(Board(500)).min_conflicts_auto(seed=7)
+    second = MinConflicts(Board(500)).min_conflicts_auto(seed=7)
+    assert list(first[0]) == list(second[0])
+    assert first[1]['steps'] == second[1]['steps'] and first[1]['restarts'] == second[1]['restarts']
@@ -0,0 +1,25 @@
+from nqueens import Board, CSP, LocalSearch
+from nqueens.profiling import Profiler
+
+
+def test_csp_counters_agree_across_backends():
+    for N in (8, 12, 20):
+        reports = []
+        for backend, heuristics in (('sets', 'scan'), ('bitmask', 'scan'), ('bitmask', 'incremental')):
+            _, stats = CSP(Board(N), backend, profiler=Profiler(), heuristics=heuristics).csp_auto()
+            counters = stats['profile']['counters']
+            reports.append((stats['steps'], counters.get('pruned'), counters.get('wipeouts', 0)))
+            assert set(stats['profile']['timers']) >= {'select_unassigned', 'order_values', 'forward_check'}
+        assert reports[0] == reports[1] == reports[2]
+
+
+def test_local_search_phase_timers():
+    profiler = Profiler()
+    _, stats = LocalSearch(Board(30), profiler=profiler).local_search_auto(seed=1)
+    profile = stats['profile']
+    proposals = profile['counters']['proposals']
+    assert profile['calls'] == {'select_move': proposals, 'evaluate_delta': proposals}
+    assert all(t > 0 for t in profile['timers'].values())
+    #reset per solve: a second run reports only itself
+    _, again = LocalSearch(Board(30), profiler=profiler).local_search_auto(seed=1)
+    assert again['profile']['counters'] == profile['counters']
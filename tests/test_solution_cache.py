@@ -0,0 +1,65 @@
+from array import array
+
+from nqueens import Board
+from nqueens.solution_cache import SolutionCache
+
+
+def test_memory_hit():
+    cache = SolutionCache()
+    board, stats = cache.solve('csp', 8, 1, backend='bitmask')
+    assert stats['success'] and not stats['cached']
+    again, stats = cache.solve('csp', 8, 1, backend='bitmask')
+    assert stats['cached'] and again == board and again is not board
+    assert (cache.hits, cache.misses) == (1, 1)
+    #other params are another key
+    _, stats = cache.solve('csp', 8, 1, backend='sets')
+    assert not stats['cached']
+
+
+def test_sqlite_hit_after_restart(tmp_path):
+    path = str(tmp_path / 'cache.db')
+    cache = SolutionCache(path)
+    board, _ = cache.solve('min_conflicts', 50, 3)
+    cache.close()
+    cache = SolutionCache(path)
+    again, stats = cache.solve('min_conflicts', 50, 3)
+    assert stats['cached'] and again == board
+    cache.close()
+
+
+def test_lru_eviction(tmp_path):
+    cache = SolutionCache(str(tmp_path / 'cache.db'), memory_size=2, disk_size=2)
+    keys = [cache.make_key(N, None, 'csp', {}) for N in (4, 5, 6)]
+    for N in (4, 5):
+        cache.solve('csp', N)
+    #touch N=4, so N=5 is the least recently used one
+    cache.solve('csp', 4)
+    cache.solve('csp', 6)
+    assert list(cache.memory) == [keys[0], keys[2]]
+    (count,) = cache.db.execute('SELECT COUNT(*) FROM solutions').fetchone()
+    assert count == 2
+    cache.close()
+
+
+def test_invalid_stored_board_is_dropped(tmp_path):
+    path = str(tmp_path / 'cache.db')
+    cache = SolutionCache(path)
+    cache.solve('csp', 8)
+    key = cache.make_key(8, None, 'csp', {})
+    cache.db.execute('UPDATE solutions SET board = ? WHERE key = ?', (array('i', [0] * 8).tobytes(), key))
+    cache.db.commit()
+    cache.close()
+    cache = SolutionCache(path)
+    assert cache.get(key) is None
+    assert cache.db.execute('SELECT COUNT(*) FROM solutions').fetchone() == (0,)
+    board, stats = cache.solve('csp', 8)
+    assert not stats['cached'] and Board.count_conflicts(board) == 0
+    cache.close()
+
+
+def test_bitmask_incremental():
+    cache = SolutionCache()
+    board, stats = cache.solve('csp', 30, 1, backend='bitmask', heuristics='incremental')
+    assert stats['success'] and Board.count_conflicts(board) == 0
+    _, stats = cache.solve('csp', 30, 1, backend='bitmask', heuristics='incremental')
+    assert stats['cached']
@@ -0,0 +1,27 @@
+import pytest
+
+from nqueens import Board
+from nqueens.solution_counter import SolutionCounter
+
+TOTAL = [1, 0, 0, 2, 10, 4, 40, 92, 352, 724]
+UNIQUE = [1, 0, 0, 1, 2, 1, 6, 12, 46, 92]
+
+
+@pytest.mark.parametrize('N', range(1, 11))
+def test_counts(N):
+    stats = SolutionCounter(Board(N)).count_all(processes=1, unique=True)
+    assert stats['total'] == TOTAL[N - 1]
+    assert stats['unique'] == UNIQUE[N - 1]
+    assert 'unique' not in SolutionCounter(Board(N)).count_all(processes=1)
+
+
+def test_pool_matches_serial():
+    assert SolutionCounter(Board(9)).count_all(processes=2)['total'] == 352
+
+
+@pytest.mark.parametrize('N', range(1, 8))
+def test_enumerate_all(N):
+    solutions = list(SolutionCounter(Board(N)).enumerate_all())
+    assert len(solutions) == TOTAL[N - 1]
+    assert solutions == sorted(solutions)
+    assert all(Board.count_conflicts(s) == 0 for s in solutions)
@@ -0,0 +1,77 @@
+import asyncio
+import time
+
+import pytest
+
+from nqueens import Board
+from nqueens.solve_service import SolveService
+
+#N=2 has no solution and the schedule never gives up: runs until cancelled
+SLOW = dict(max_steps=10 ** 9, restart_limit=0, stagnation_limit=10 ** 9)
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+def test_solve_and_coalesce():
+    async def main():
+        async with SolveService(2) as service:
+            (a, sa), (b, sb) = await asyncio.gather(service.solve('csp', 12, backend='bitmask'),
+                                                    service.solve('csp', 12, backend='bitmask'))
+            assert sa['success'] and sb['success']
+            assert a == b and a is not b and Board.count_conflicts(a) == 0
+            assert sorted([sa['coalesced'], sb['coalesced']]) == [False, True]
+            assert not service._jobs
+            #the worker is reused for the next job
+            assert len(service._idle) == 1
+            sol, stats = await service.solve('constructive', 9)
+            assert stats['success'] and not stats['coalesced']
+            assert len(service._idle) == 1
+    run(main())
+
+
+def test_per_waiter_deadline():
+    async def main():
+        async with SolveService(2) as service:
+            start = time.time()
+            short = asyncio.ensure_future(service.solve('local_search', 2, 1, deadline=0.2, **SLOW))
+            long = asyncio.ensure_future(service.solve('local_search', 2, 1, deadline=1.0, **SLOW))
+            _, stats = await short
+            assert stats['timeout'] and time.time() - start < 0.8
+            #the shared job goes on for the waiter with the later deadline
+            assert len(service._jobs) == 1
+            _, stats = await long
+            assert stats['timeout'] and stats['coalesced'] and time.time() - start >= 0.9
+            await asyncio.sleep(0.05)
+            assert not service._jobs
+    run(main())
+
+
+def test_cancel():
+    async def main():
+        async with SolveService(2) as service:
+            task = asyncio.ensure_future(service.solve('local_search', 2, 1, **SLOW))
+            await asyncio.sleep(0.2)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+            await asyncio.sleep(0.05)
+            assert not service._jobs
+            #the cancelled job's worker was killed, not returned to the pool
+            assert not service._idle
+    run(main())
+
+
+def test_resubmit_after_cancel():
+    #a request arriving while the cancelled job is still winding down starts its own job
+    async def main():
+        async with SolveService(2) as service:
+            task = asyncio.ensure_future(service.solve('local_search', 2, 1, **SLOW))
+            await asyncio.sleep(0.2)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+            sol, stats = await service.solve('local_search', 2, 1, deadline=0.3, **SLOW)
+            assert sol is None and stats['timeout'] and not stats['coalesced']
+    run(main())
@@ -0,0 +1,51 @@
+from nqueens import Board, CSP, LocalSearch
+from nqueens.step_events import BoardReplayer
+
+
+def test_local_search_replay():
+    #replayed boards agree with the event's conflict count and end on the auto-mode result
+    N = 12
+    for every in (1, 7):
+        replayer = BoardReplayer(N)
+        kinds = []
+        for event in LocalSearch(Board(N)).local_search_events(every=every, max_steps=5000, seed=3):
+            board = replayer.apply(event)
+            kinds.append(event.kind)
+            assert -1 not in board
+            assert Board.count_conflicts(board) == event.conflicts
+        expected, stats = LocalSearch(Board(N)).local_search_auto(max_steps=5000, seed=3)
+        assert kinds[-1] == ('solved' if stats['success'] else 'failed')
+        if stats['success']:
+            assert replayer.snapshot() == expected
+
+
+def test_local_search_replay_matches_step_mode():
+    #the board replayed at every step equals the step-mode board of the same (restart, step)
+    N = 10
+    #explicit schedule: the result must not depend on the shipped tuning profile
+    params = dict(max_steps=300, restart_limit=2, seed=1, initial_temp=1000.0, cooling=1.0, stagnation_limit=10 ** 6)
+    replayer = BoardReplayer(N)
+    replayed = {}
+    for event in LocalSearch(Board(N)).local_search_events(**params):
+        board = replayer.apply(event)
+        if event.kind == 'step':
+            replayed[event.restarts, event.step] = list(board)
+    stepped = {}
+    for board, info in LocalSearch(Board(N)).local_search_step(**params):
+        if 'temperature' in info:
+            stepped[info['restarts'], info['steps']] = board
+    assert len(replayed) == 900
+    assert replayed == stepped
+
+
+def test_csp_replay():
+    N = 16
+    expected, stats = CSP(Board(N), 'bitmask').csp_auto()
+    for every in (1, 5):
+        replayer = BoardReplayer(N)
+        for event in CSP(Board(N), 'bitmask').csp_events(every=every):
+            board = replayer.apply(event)
+            assert sum(1 for r in board if r >= 0) == event.assigned
+        assert event.kind == 'solved'
+        assert replayer.snapshot() == expected
+        assert event.step == stats['steps']